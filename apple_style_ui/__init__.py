@@ -0,0 +1,129 @@
+"""
+Apple-style UI components for PyQt6.
+
+Names are resolved lazily: `import apple_style_ui` loads nothing, and
+`from apple_style_ui import LIGHT_THEME` loads only the Qt-free theme core.
+A widget's submodule (and Qt) is imported on first access to that widget.
+"""
+import importlib
+
+_EXPORTS = {
+    # theme
+    "LIGHT_COLORS": "theme",
+    "DARK_COLORS": "theme",
+    "Theme": "theme",
+    "LIGHT_THEME": "theme",
+    "DARK_THEME": "theme",
+    "register_theme": "theme",
+    "get_theme": "theme",
+    "available_themes": "theme",
+    "active_theme": "theme",
+    "activate_theme": "theme",
+    "get_color": "theme",
+    "update_palette": "theme",
+    "THEME": "theme",
+    # fonts
+    "FONT_FAMILIES": "fonts",
+    "FONT_ROLES": "fonts",
+    "FontFactory": "fonts",
+    "font_factory": "fonts",
+    # styling
+    "BORDER_RADIUS_PX": "styling",
+    "BORDER_RADIUS": "styling",
+    "cached_stylesheet": "styling",
+    "invalidate_stylesheet_cache": "styling",
+    "glyph_pixmap": "styling",
+    "invalidate_glyph_cache": "styling",
+    "set_style_mode": "styling",
+    "apply_widget_stylesheet": "styling",
+    "set_style_property": "styling",
+    "shared_stylesheet_scope": "styling",
+    "uses_shared_stylesheet": "styling",
+    "application_stylesheet": "styling",
+    "apply_application_stylesheet": "styling",
+    "register_application_style": "styling",
+    "ThemeRegistry": "styling",
+    "theme_registry": "styling",
+    "STYLE_MODE": "styling",
+    "APPLICATION_STYLED_CLASSES": "styling",
+    # rendering
+    "RenderCache": "rendering",
+    "render_cache": "rendering",
+    # animation
+    "ANIMATION_DURATION_MS": "animation",
+    "AnimationClock": "animation",
+    "animation_clock": "animation",
+    # async_support
+    "AsyncioDriver": "async_support",
+    "asyncio_driver": "async_support",
+    # button
+    "AnimatedButton": "button",
+    "AppleStyleButton": "button",
+    # label
+    "AppleStyleLabel": "label",
+    "AppleStyleMessageLabel": "label",
+    # line_edit
+    "PathDropHandler": "line_edit",
+    "AppleStyleLineEdit": "line_edit",
+    # text_edit
+    "AppleStyleTextEdit": "text_edit",
+    "AppleStylePlainTextEdit": "text_edit",
+    # check_box
+    "AppleStyleCheckBox": "check_box",
+    # switch
+    "AppleStyleSwitch": "switch",
+    # slider
+    "AppleStyleSlider": "slider",
+    # radio_button
+    "AppleStyleRadioButton": "radio_button",
+    # combo_box
+    "IncrementalStringListModel": "combo_box",
+    "AppleStyleComboBox": "combo_box",
+    # date_edit
+    "AppleStyleDateEdit": "date_edit",
+    # progress_bar
+    "ProgressReporter": "progress_bar",
+    "AppleStyleProgressBar": "progress_bar",
+    # item_views
+    "AppleStyleItemDelegate": "item_views",
+    "AppleStyleCheckBoxDelegate": "item_views",
+    "AppleStyleSwitchDelegate": "item_views",
+    "AppleStyleProgressDelegate": "item_views",
+    "AppleStyleListView": "item_views",
+    "AppleStyleTableView": "item_views",
+    # settings
+    "SettingsStore": "settings",
+    # form
+    "FIELD_TYPES": "form",
+    "register_field_type": "form",
+    "FormField": "form",
+    "AppleStyleForm": "form",
+    "build_form": "form",
+    # profiling
+    "Instrumentation": "profiling",
+    "instrumentation": "profiling",
+    "InstrumentationHUD": "profiling",
+    # window
+    "VirtualContentArea": "window",
+    "AppleStyleToast": "window",
+    "LazyContentSlot": "window",
+    "AppleStyleSection": "window",
+    "AppleStyleWindow": "window",
+}
+
+# Module-level state that changes at runtime; looked up on every access instead of cached
+_LIVE_NAMES = {"THEME", "STYLE_MODE", "LIGHT_COLORS", "DARK_COLORS"}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    if name not in _LIVE_NAMES:
+        globals()[name] = value # Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
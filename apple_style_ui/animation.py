@@ -0,0 +1,122 @@
+"""One shared clock for every widget transition."""
+from PyQt6 import sip
+from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, QEasingCurve, QElapsedTimer, QTimer, QObject
+
+# --- Animation Clock ---
+ANIMATION_DURATION_MS = 150 # アニメーション時間 (ミリ秒)
+
+def _interpolate(start, end, progress):
+    if isinstance(start, QColor):
+        return QColor(
+            round(start.red() + (end.red() - start.red()) * progress),
+            round(start.green() + (end.green() - start.green()) * progress),
+            round(start.blue() + (end.blue() - start.blue()) * progress),
+            round(start.alpha() + (end.alpha() - start.alpha()) * progress),
+        )
+    value = start + (end - start) * progress
+    return round(value) if isinstance(start, int) and isinstance(end, int) else value
+
+class _Transition:
+    __slots__ = ("owner", "name", "start_value", "end_value", "duration", "easing", "started")
+
+class AnimationClock(QObject):
+    """
+    Drives every widget transition from one timer. All running transitions are
+    advanced from the same frame timestamp, the frame rate is capped by
+    set_frame_rate(), and set_reduced_motion(True) snaps transitions to their
+    final value. Transitions write a Python attribute or pyqtProperty by name.
+    """
+    def __init__(self, frame_rate=60):
+        super().__init__()
+        self._timer = None # Created on first use so the clock can exist before QApplication
+        self._frame_interval = max(1, round(1000 / frame_rate))
+        self._clock = QElapsedTimer()
+        self._transitions = {}
+        self._easing_curves = {}
+        self.reduced_motion = False
+
+    def set_frame_rate(self, frame_rate):
+        self._frame_interval = max(1, round(1000 / frame_rate))
+        if self._timer is not None:
+            self._timer.setInterval(self._frame_interval)
+
+    def frame_rate(self):
+        return 1000 / self._frame_interval
+
+    def set_reduced_motion(self, enabled):
+        self.reduced_motion = enabled
+        if enabled:
+            for key in list(self._transitions):
+                self._finish(key)
+
+    def animate(self, owner, name, start_value, end_value, duration_ms=ANIMATION_DURATION_MS,
+                easing=QEasingCurve.Type.InOutQuad):
+        # Replaces any running transition of the same owner and property
+        key = (id(owner), name)
+        if self.reduced_motion or duration_ms <= 0:
+            self._transitions.pop(key, None)
+            setattr(owner, name, end_value)
+            return
+        transition = _Transition()
+        transition.owner = owner
+        transition.name = name
+        transition.start_value = start_value
+        transition.end_value = end_value
+        transition.duration = duration_ms
+        transition.easing = self._easing_curve(easing)
+        transition.started = self._now()
+        self._transitions[key] = transition
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self, owner, name):
+        self._transitions.pop((id(owner), name), None)
+
+    def is_running(self, owner, name):
+        return (id(owner), name) in self._transitions
+
+    def running_count(self):
+        return len(self._transitions)
+
+    def _easing_curve(self, easing):
+        curve = self._easing_curves.get(easing)
+        if curve is None:
+            curve = self._easing_curves[easing] = QEasingCurve(easing)
+        return curve
+
+    def _ensure_timer(self):
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._timer.setInterval(self._frame_interval)
+            self._timer.timeout.connect(self._tick)
+            self._clock.start()
+        return self._timer
+
+    def _now(self):
+        self._ensure_timer()
+        return self._clock.elapsed()
+
+    def _finish(self, key):
+        transition = self._transitions.pop(key)
+        if not sip.isdeleted(transition.owner):
+            setattr(transition.owner, transition.name, transition.end_value)
+
+    def _tick(self):
+        now = self._clock.elapsed() # One timestamp for the whole frame
+        for key, transition in list(self._transitions.items()):
+            if sip.isdeleted(transition.owner):
+                del self._transitions[key]
+                continue
+            progress = (now - transition.started) / transition.duration
+            if progress >= 1:
+                self._finish(key)
+            else:
+                eased = transition.easing.valueForProgress(progress)
+                setattr(transition.owner, transition.name,
+                        _interpolate(transition.start_value, transition.end_value, eased))
+        if not self._transitions:
+            self._timer.stop()
+
+animation_clock = AnimationClock()
@@ -0,0 +1,151 @@
+"""asyncio event loop stepped by the Qt event loop."""
+import asyncio
+import heapq
+import math
+import selectors
+from PyQt6.QtCore import Qt, QTimer, QObject, QSocketNotifier
+
+class _NotifierSelector(selectors.DefaultSelector):
+    # A selector that also watches every registered file descriptor with a QSocketNotifier,
+    # so that I/O readiness wakes the Qt event loop, which then steps the asyncio loop.
+    def __init__(self, wake):
+        super().__init__()
+        self._wake = wake
+        self._notifiers = {} # fd -> [QSocketNotifier]
+
+    def _watch(self, key):
+        notifiers = []
+        for event, kind in ((selectors.EVENT_READ, QSocketNotifier.Type.Read),
+                            (selectors.EVENT_WRITE, QSocketNotifier.Type.Write)):
+            if key.events & event:
+                notifier = QSocketNotifier(key.fd, kind)
+                notifier.activated.connect(self._wake)
+                notifiers.append(notifier)
+        self._notifiers[key.fd] = notifiers
+
+    def _unwatch(self, fd):
+        for notifier in self._notifiers.pop(fd, ()):
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+
+    def register(self, fileobj, events, data=None):
+        key = super().register(fileobj, events, data)
+        self._watch(key)
+        return key
+
+    def unregister(self, fileobj):
+        key = super().unregister(fileobj)
+        self._unwatch(key.fd)
+        return key
+
+    def modify(self, fileobj, events, data=None):
+        key = super().modify(fileobj, events, data)
+        self._unwatch(key.fd)
+        self._watch(key)
+        return key
+
+    def close(self):
+        for fd in list(self._notifiers):
+            self._unwatch(fd)
+        super().close()
+
+class _SteppedEventLoop(asyncio.SelectorEventLoop):
+    # Records what the loop has to do next through its public scheduling methods: whether a
+    # callback is ready, and the deadlines of call_at()/call_later() timers.
+    def __init__(self, wake):
+        self.callback_ready = False
+        self._deadlines = [] # heap of (when, sequence, TimerHandle)
+        self._deadline_sequence = 0
+        super().__init__(_NotifierSelector(wake))
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self.callback_ready = True
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super().call_at(when, callback, *args, context=context)
+        self._deadline_sequence += 1
+        heapq.heappush(self._deadlines, (when, self._deadline_sequence, handle))
+        return handle
+
+    def next_deadline(self, stepped_at):
+        # Earliest pending timer, or None. Timers due before the step started have run.
+        deadlines = self._deadlines
+        while deadlines and (deadlines[0][0] < stepped_at or deadlines[0][2].cancelled()):
+            heapq.heappop(deadlines)
+        return deadlines[0][0] if deadlines else None
+
+class AsyncioDriver(QObject):
+    """
+    Runs an asyncio event loop inside the Qt event loop on the GUI thread.
+    While tasks are pending, a timer steps the loop: each step runs the ready
+    callbacks and polls I/O without blocking, so coroutines may touch widgets
+    directly. Steps are only taken when there is work: at once when callbacks
+    are ready, at the earliest call_later() deadline, or when a socket
+    notifier reports that a watched file descriptor (including the loop's
+    call_soon_threadsafe() wakeup) is ready. The timer stops when no task is
+    left.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._loop = None
+        self._timer = None # Created on first use so the driver can exist before QApplication
+        self._tasks = set()
+
+    def loop(self):
+        if self._loop is None or self._loop.is_closed():
+            self._loop = _SteppedEventLoop(self._wake)
+            asyncio.set_event_loop(self._loop)
+        return self._loop
+
+    def create_task(self, coro):
+        task = self.loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._timer.timeout.connect(self._step)
+        self._wake() # The new task's first step is ready now
+        return task
+
+    def _wake(self, *args):
+        self._schedule(0)
+
+    def _schedule(self, interval_ms):
+        if self._timer is not None and self._tasks and \
+                (not self._timer.isActive() or self._timer.remainingTime() > interval_ms):
+            self._timer.start(interval_ms)
+
+    def _step(self):
+        loop = self._loop
+        if loop.is_running():
+            return # Re-entered from a nested Qt event loop started by a coroutine
+        stepped_at = loop.time()
+        loop.call_soon(loop.stop)
+        loop.callback_ready = False
+        loop.run_forever() # Runs one iteration: stop() is already scheduled
+        if not self._tasks:
+            return
+        if loop.callback_ready:
+            self._schedule(0)
+        else:
+            deadline = loop.next_deadline(stepped_at)
+            if deadline is not None:
+                self._schedule(max(0, math.ceil((deadline - loop.time()) * 1000)))
+            # Otherwise the tasks wait on I/O or other threads; a socket notifier wakes the driver
+
+    def cancel(self, tasks, timeout=1.0):
+        # Cancels `tasks` and runs the loop until they have finished, for at most `timeout` seconds
+        tasks = [task for task in tasks if not task.done()]
+        if not tasks:
+            return
+        for task in tasks:
+            task.cancel()
+        if not self._loop.is_running():
+            self._loop.run_until_complete(asyncio.wait(tasks, timeout=timeout))
+
+asyncio_driver = AsyncioDriver()
@@ -0,0 +1,151 @@
+"""Animated push buttons."""
+from PyQt6.QtWidgets import QPushButton
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtCore import Qt, pyqtProperty, QRectF
+
+from .theme import active_theme
+from .fonts import font_factory
+from .styling import BORDER_RADIUS_PX, BORDER_RADIUS, cached_stylesheet, set_style_property, uses_shared_stylesheet, register_application_style, theme_registry
+from .animation import animation_clock
+
+class AnimatedButton(QPushButton):
+    """
+    背景色のアニメーションを持つ基本的なボタンクラス。
+    AppleStyleButtonのベースとなります。
+    """
+    def __init__(self, text="", parent=None, is_secondary=False):
+        super().__init__(text, parent)
+        self.is_secondary = is_secondary
+
+        # Initialize all color attributes, including _current_bg_color
+        self._update_colors() # Load colors based on current theme
+
+        # This is the crucial attribute for the backgroundColor property
+        self._current_bg_color = self._default_bg_color
+
+        self._apply_style()
+        theme_registry.register(self)
+
+    def _update_colors(self):
+        theme = active_theme()
+        if self.is_secondary:
+            self._default_bg_color = theme.color.separator
+            self._hover_bg_color = theme.color.disabled_background
+            self._pressed_bg_color = theme.color.input_border
+            self._text_color = theme.color.text_primary
+        else:
+            self._default_bg_color = theme.color.accent
+            self._hover_bg_color = theme.color.accent_hover
+            self._pressed_bg_color = theme.color.accent_pressed
+            self._text_color = QColor("white") # Default for accent buttons
+        self._disabled_bg_color = theme.color.disabled_background
+        self._disabled_text_color = theme.color.disabled_text
+
+    def _apply_style(self):
+        # The background is painted in paintEvent so that animation frames only
+        # cost a repaint. The stylesheet carries the static parts and only needs
+        # re-applying when the text color changes.
+        text_color_name = self._text_color.name() # Use the instance variable
+        set_style_property(self, "secondary", self.is_secondary)
+        role_text_color_name = active_theme().hex.text_primary if self.is_secondary else "#ffffff"
+        if uses_shared_stylesheet(self) and text_color_name == role_text_color_name:
+            if self.styleSheet():
+                self.setStyleSheet("")
+        else:
+            # Custom text colors are not expressible as a shared rule, so they keep a local stylesheet
+            self.setStyleSheet(cached_stylesheet(AnimatedButton, self._build_style, text_color_name))
+        self.update()
+
+    @staticmethod
+    def _build_style(theme, text_color_name, selector="QPushButton"):
+        return f"""
+            {selector} {{
+                background-color: transparent;
+                color: {text_color_name};
+                border: none; /* 通常は枠線なし */
+                padding: 10px 20px;
+                border-radius: {BORDER_RADIUS};
+                font-size: 14px; /* 基本フォントサイズ */
+                font-weight: 500; /* Medium weight for SF Pro Text like feel */
+            }}
+            {selector}:disabled {{
+                color: {theme.hex.disabled_text};
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "#ffffff", "AnimatedButton") + \
+               cls._build_style(theme, theme.hex.text_primary, 'AnimatedButton[secondary="true"]')
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._current_bg_color if self.isEnabled() else self._disabled_bg_color)
+        painter.drawRoundedRect(QRectF(self.rect()), BORDER_RADIUS_PX, BORDER_RADIUS_PX)
+        painter.end()
+        super().paintEvent(event) # Draws the label on top of the background
+
+    @pyqtProperty(QColor)
+    def backgroundColor(self):
+        return self._current_bg_color
+
+    @backgroundColor.setter
+    def backgroundColor(self, color):
+        if self._current_bg_color != color:
+            self._current_bg_color = color
+            self.update() # Animation frames only schedule a repaint
+
+    def _animate_background(self, color):
+        # Replaces any running background animation (既存のアニメーションを停止)
+        animation_clock.animate(self, "backgroundColor", self.backgroundColor, color)
+
+    def enterEvent(self, event):
+        if self.isEnabled():
+            self._animate_background(self._hover_bg_color)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        if self.isEnabled():
+            self._animate_background(self._default_bg_color)
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        if self.isEnabled() and event.button() == Qt.MouseButton.LeftButton:
+            animation_clock.stop(self, "backgroundColor")
+            self.backgroundColor = self._pressed_bg_color
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if self.isEnabled() and event.button() == Qt.MouseButton.LeftButton:
+            if self.underMouse():
+                self._animate_background(self._hover_bg_color)
+            else:
+                # マウスがボタンの外でリリースされた場合
+                self.backgroundColor = self._default_bg_color
+        super().mouseReleaseEvent(event)
+
+    def setEnabled(self, enabled):
+        super().setEnabled(enabled)
+        if enabled:
+            self.backgroundColor = self._default_bg_color
+        else:
+            self.backgroundColor = self._disabled_bg_color
+        self._apply_style()
+
+    def update_theme(self):
+        old_default_bg = self._default_bg_color
+        self._update_colors() # Picks the primary or secondary palette from is_secondary
+        # A hovered or pressed color is left as is; the next mouse event animates to the new palette
+        if self.backgroundColor == old_default_bg or not self.isEnabled():
+            self.backgroundColor = self._default_bg_color if self.isEnabled() else self._disabled_bg_color
+        self._apply_style()
+
+
+class AppleStyleButton(AnimatedButton):
+    def __init__(self, text, parent=None, is_secondary=False):
+        super().__init__(text, parent, is_secondary)
+        self.setFont(font_factory.font("button"))
+
+register_application_style(AnimatedButton)
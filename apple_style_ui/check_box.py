@@ -0,0 +1,105 @@
+"""Check box with a cached checkmark glyph."""
+from PyQt6.QtWidgets import QCheckBox, QStyleOptionButton, QStyle
+from PyQt6.QtGui import QColor, QPainter, QPen
+from PyQt6.QtCore import Qt, QEvent
+
+from .fonts import font_factory
+from .styling import glyph_pixmap, apply_widget_stylesheet, register_application_style, theme_registry
+
+class AppleStyleCheckBox(QCheckBox):
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self._cached_indicator_rect = None
+        self.setFont(font_factory.font("body"))
+        self._apply_style()
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        theme_registry.register(self)
+
+    def wheelEvent(self, event):
+        if self.hasFocus():
+            super().wheelEvent(event)
+        else:
+            event.ignore()
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleCheckBox, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QCheckBox"):
+        return f"""
+            {selector} {{
+                spacing: 8px;
+                color: {theme.hex.text_primary};
+            }}
+            {selector}::indicator {{
+                width: 18px;
+                height: 18px;
+                border: 1px solid {theme.hex.input_border};
+                border-radius: 4px;
+                background-color: {theme.hex.background_secondary};
+            }}
+            {selector}::indicator:checked {{
+                background-color: {theme.hex.accent};
+                border: 1px solid {theme.hex.accent};
+            }}
+            {selector}::indicator:disabled {{
+                background-color: {theme.hex.disabled_background};
+                border: 1px solid {theme.hex.separator};
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleCheckBox")
+    def update_theme(self):
+        self._apply_style()
+
+    def _indicator_rect(self):
+        # Cached until the geometry, style, font or layout direction changes
+        if self._cached_indicator_rect is None:
+            opt = QStyleOptionButton()
+            self.initStyleOption(opt) # Initialize style option from the widget
+            self._cached_indicator_rect = self.style().subElementRect(QStyle.SubElement.SE_CheckBoxIndicator, opt, self)
+        return self._cached_indicator_rect
+
+    def resizeEvent(self, event):
+        self._cached_indicator_rect = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.FontChange, QEvent.Type.LayoutDirectionChange):
+            self._cached_indicator_rect = None
+        super().changeEvent(event)
+
+    @staticmethod
+    def _render_checkmark(painter, indicator_rect, theme, enabled):
+        # Define checkmark properties
+        pen = QPen(QColor("white") if enabled else theme.color.disabled_text) # Checkmark color
+        pen.setWidth(2) # Checkmark line thickness
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap) # Rounded ends for the checkmark
+        painter.setPen(pen)
+
+        # Calculate points for a simple "L" shaped checkmark
+        # These are relative to the indicator_rect and might need adjustment for perfect centering/sizing
+        padding = indicator_rect.width() * 0.25 # Padding from edges
+        x1 = indicator_rect.left() + padding
+        y1 = indicator_rect.top() + indicator_rect.height() * 0.5
+        x2 = indicator_rect.left() + indicator_rect.width() * 0.45
+        y2 = indicator_rect.top() + indicator_rect.height() - padding
+        x3 = indicator_rect.right() - padding
+        y3 = indicator_rect.top() + indicator_rect.height() * 0.35
+
+        painter.drawLine(int(x1), int(y1), int(x2), int(y2)) # Draw first part of checkmark
+        painter.drawLine(int(x2), int(y2), int(x3), int(y3)) # Draw second part of checkmark
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.isChecked():
+            indicator_rect = self._indicator_rect()
+            pixmap = glyph_pixmap("checkmark", indicator_rect.size(), self.devicePixelRatioF(),
+                                  self.isEnabled(), self._render_checkmark)
+            painter = QPainter(self)
+            painter.drawPixmap(indicator_rect.topLeft(), pixmap)
+            painter.end()
+
+register_application_style(AppleStyleCheckBox)
@@ -0,0 +1,294 @@
+"""Combo box with an indexed search mode for large item sets."""
+import bisect
+import itertools
+from PyQt6.QtWidgets import QComboBox, QListView, QCompleter
+from PyQt6.QtCore import Qt, QTimer, QThread, QAbstractListModel, QModelIndex, QStringListModel, pyqtSignal
+
+from .fonts import font_factory
+from .styling import BORDER_RADIUS, apply_widget_stylesheet, register_application_style, theme_registry
+
+class IncrementalStringListModel(QAbstractListModel):
+    """Read-only list model over a Python sequence that exposes rows in batches through fetchMore()."""
+    def __init__(self, items, batch_size=1000, parent=None):
+        super().__init__(parent)
+        self._items = items
+        self._batch_size = batch_size
+        self._loaded = 0
+        self._fetching = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole) and 0 <= index.row() < self._loaded:
+            return self._items[index.row()]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._items)
+
+    def fetchMore(self, parent=QModelIndex()):
+        self.fetchTo(self._loaded + self._batch_size - 1)
+
+    def fetchTo(self, row):
+        # Makes rows up to and including `row` available
+        last = min(row, len(self._items) - 1)
+        if last >= self._loaded and not self._fetching:
+            # Views react to rowsInserted by fetching again; without the guard each batch recurses
+            self._fetching = True
+            try:
+                self.beginInsertRows(QModelIndex(), self._loaded, last)
+                self._loaded = last + 1
+                self.endInsertRows()
+            finally:
+                self._fetching = False
+
+class _SearchIndex:
+    # Case-insensitive prefix and substring lookup. Prefixes are found by bisecting the
+    # sorted keys; substrings with str.find over one joined string, which runs in C and
+    # jumps straight from match to match. scan() works on a character range so that
+    # callers can spread a long scan over several event-loop turns.
+    def __init__(self, items):
+        self.keys = [str(item).casefold() for item in items]
+        self._order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._sorted_keys = [self.keys[i] for i in self._order]
+        self._haystack = "\n".join(self.keys)
+        self._starts = list(itertools.accumulate((len(key) + 1 for key in self.keys), initial=0))
+
+    def __len__(self):
+        return len(self._haystack)
+
+    def prefix(self, query, limit):
+        results = []
+        position = bisect.bisect_left(self._sorted_keys, query)
+        while position < len(self._sorted_keys) and len(results) < limit and self._sorted_keys[position].startswith(query):
+            results.append(self._order[position])
+            position += 1
+        return results
+
+    def scan(self, query, start, end, exclude, results, limit):
+        # Appends items containing `query` that start in [start, end); returns where to resume
+        haystack, starts = self._haystack, self._starts
+        found = haystack.find(query, start, end + len(query))
+        while found >= 0 and len(results) < limit:
+            item = bisect.bisect_right(starts, found) - 1
+            if item not in exclude:
+                results.append(item)
+            start = starts[item + 1] # One hit per item is enough
+            found = haystack.find(query, start, end + len(query)) if start < end else -1
+        return start if len(results) >= limit else max(start, end)
+
+    def search(self, text, limit):
+        query = text.casefold()
+        if not query:
+            return list(range(min(limit, len(self.keys))))
+        results = self.prefix(query, limit)
+        self.scan(query, 0, len(self), set(results), results, limit)
+        return results
+
+class _SearchIndexBuilder(QThread):
+    # Unparented and kept in _running_builders until it finishes, so that destroying the
+    # combo box never destroys a running thread; the combo box only receives indexBuilt.
+    indexBuilt = pyqtSignal(object)
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = items
+
+    def run(self):
+        self.indexBuilt.emit(_SearchIndex(self.items))
+
+_running_builders = set()
+
+class AppleStyleComboBox(QComboBox):
+    SEARCH_RESULT_LIMIT = 200 # Rows shown in the search popup
+    SEARCH_SLICE_CHARS = 2 * 1024 * 1024 # Substring scan per event-loop turn, roughly 2 ms
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFont(font_factory.font("body"))
+        self._apply_style()
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.DefaultContextMenu)
+        self._search_index = None
+        self._search_rows = []
+        self._search_query = ""
+        self._search_position = None # Where the running substring scan resumes; None when complete
+        self._search_line_edit = None # Line edit whose textEdited drives the search
+        self._search_completer = None
+        self._search_builder = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self._continue_search)
+        theme_registry.register(self)
+
+    def setSearchItems(self, items, batch_size=1000):
+        """
+        Model-backed mode for large item sets: rows are fetched incrementally,
+        and a prefix/substring index is built on a background thread. Typing
+        into the (now editable) combo box filters a completer popup.
+        """
+        # Drop any scan still running over the previous items before the index is replaced
+        self._search_timer.stop()
+        self._search_items = items
+        self._search_index = None
+        self._search_rows = []
+        self._search_query = ""
+        self._search_position = None
+        self.setModel(IncrementalStringListModel(items, batch_size, self)) # Deletes the previous model
+        if isinstance(self.view(), QListView):
+            self.view().setUniformItemSizes(True)
+        self.setEditable(True)
+        self.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+
+        # One completer over one result model, reused by later calls
+        if self._search_completer is None:
+            self._search_model = QStringListModel(self)
+            self._search_completer = QCompleter(self._search_model, self)
+            self._search_completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion) # Filtering is done by the index
+            self._search_completer.activated[QModelIndex].connect(self._select_search_result)
+        else:
+            self._search_model.setStringList([])
+            self._search_completer.setModel(self._search_model) # setModel() hands the completer the item model
+        self._search_completer.setMaxVisibleItems(self.maxVisibleItems())
+        if self.completer() is not self._search_completer:
+            self.setCompleter(self._search_completer)
+        if self._search_line_edit is not self.lineEdit():
+            self._search_line_edit = self.lineEdit()
+            self._search_line_edit.textEdited.connect(self._update_search_results)
+
+        builder = _SearchIndexBuilder(items)
+        builder.indexBuilt.connect(self._install_search_index)
+        builder.finished.connect(lambda: (_running_builders.discard(builder), builder.deleteLater()))
+        _running_builders.add(builder)
+        self._search_builder = builder
+        builder.start()
+
+    def _install_search_index(self, index):
+        if self.sender() is self._search_builder:
+            self._search_builder = None
+            self._search_index = index
+            if self.lineEdit() is not None and self.lineEdit().hasFocus():
+                self._update_search_results(self.lineEdit().text())
+
+    def searchItems(self, text, limit=200):
+        # Item positions matching `text`; prefix matches first. Empty until the index is ready,
+        # as a scan of a large item set on the GUI thread would stall typing.
+        query = text.casefold()
+        if not query:
+            return list(range(min(limit, len(self._search_items))))
+        if self._search_index is None:
+            return []
+        return self._search_index.search(text, limit)
+
+    def _update_search_results(self, text):
+        # Prefix matches are shown at once; the substring scan continues in slices on later turns
+        index = self._search_index
+        query = text.casefold()
+        self._search_timer.stop()
+        if index is None or not query:
+            self._search_rows = self.searchItems(text, self.SEARCH_RESULT_LIMIT)
+            self._search_position = None
+        elif self._search_position is None and self._search_query and query.startswith(self._search_query) \
+                and len(self._search_rows) < self.SEARCH_RESULT_LIMIT:
+            # The previous result set was complete, so a longer query can only narrow it
+            self._search_rows = [row for row in self._search_rows if query in index.keys[row]]
+        else:
+            self._search_rows = index.prefix(query, self.SEARCH_RESULT_LIMIT)
+            self._search_prefix_rows = set(self._search_rows)
+            self._search_position = 0
+        self._search_query = query
+        if self._search_position is not None:
+            self._continue_search()
+        else:
+            self._show_search_results()
+
+    def _continue_search(self):
+        index = self._search_index
+        if index is None or self._search_position is None or self._search_position < 0:
+            return
+        end = min(self._search_position + self.SEARCH_SLICE_CHARS, len(index))
+        self._search_position = index.scan(self._search_query, self._search_position, end,
+                                           self._search_prefix_rows, self._search_rows, self.SEARCH_RESULT_LIMIT)
+        if self._search_position >= len(index):
+            self._search_position = None
+        elif len(self._search_rows) >= self.SEARCH_RESULT_LIMIT:
+            self._search_position = -1 # Truncated; a longer query has to scan again
+        else:
+            self._search_timer.start()
+        self._show_search_results()
+
+    def _show_search_results(self):
+        self._search_model.setStringList([str(self._search_items[row]) for row in self._search_rows])
+        if self._search_query and self._search_rows:
+            if not self.completer().popup().isVisible():
+                self.completer().complete()
+        else:
+            self.completer().popup().hide()
+
+    def _select_search_result(self, index):
+        row = self._search_rows[index.row()]
+        self.model().fetchTo(row)
+        self.setCurrentIndex(row)
+
+    def wheelEvent(self, event):
+        # print(f"AppleStyleComboBox wheelEvent: hasFocus() = {self.hasFocus()}")
+        if self.hasFocus():
+            # print("AppleStyleComboBox: Processing wheel event")
+            super().wheelEvent(event)
+        else:
+            # print("AppleStyleComboBox: Ignoring wheel event")
+            event.ignore()
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleComboBox, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QComboBox"):
+        return f"""
+            {selector} {{
+                color: {theme.hex.text_primary};
+                background-color: {theme.hex.background_secondary};
+                border: 1px solid {theme.hex.input_border};
+                border-radius: {BORDER_RADIUS};
+                padding: 5px 10px;
+                min-height: 22px;
+            }}
+            {selector}:focus {{
+                border: 1.5px solid {theme.hex.input_border_focus};
+            }}
+            {selector}:disabled {{
+                background-color: {theme.hex.disabled_background};
+                color: {theme.hex.disabled_text};
+            }}
+            {selector} QAbstractItemView {{
+                background-color: {theme.hex.background_secondary};
+                color: {theme.hex.text_primary};
+                border: 1px solid {theme.hex.input_border};
+                selection-background-color: {theme.hex.accent};
+                selection-color: white;
+                outline: 0px;
+            }}
+            {selector}::drop-down {{
+                subcontrol-origin: padding;
+                subcontrol-position: top right;
+                width: 25px;
+                border-left-width: 1px;
+                border-left-color: {theme.hex.separator};
+                border-left-style: solid;
+                border-top-right-radius: {BORDER_RADIUS};
+                border-bottom-right-radius: {BORDER_RADIUS};
+            }}
+            {selector}::down-arrow {{
+                width: 12px;
+                height: 12px;
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleComboBox")
+    def update_theme(self):
+        self._apply_style()
+
+register_application_style(AppleStyleComboBox)
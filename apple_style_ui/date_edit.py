@@ -0,0 +1,95 @@
+"""Date input with a calendar popup."""
+from PyQt6.QtWidgets import QDateEdit
+from PyQt6.QtCore import Qt
+
+from .fonts import font_factory
+from .styling import BORDER_RADIUS, apply_widget_stylesheet, register_application_style, theme_registry
+
+class AppleStyleDateEdit(QDateEdit):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFont(font_factory.font("body"))
+        self.setCalendarPopup(True)
+        self._apply_style()
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        theme_registry.register(self)
+
+    def wheelEvent(self, event):
+        # print(f"AppleStyleDateEdit wheelEvent: hasFocus() = {self.hasFocus()}")
+        if self.hasFocus():
+            # print("AppleStyleDateEdit: Processing wheel event")
+            super().wheelEvent(event)
+        else:
+            # print("AppleStyleDateEdit: Ignoring wheel event")
+            event.ignore()
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleDateEdit, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QDateEdit"):
+        return f"""
+            {selector} {{
+                color: {theme.hex.text_primary};
+                background-color: {theme.hex.background_secondary};
+                border: 1px solid {theme.hex.input_border};
+                border-radius: {BORDER_RADIUS};
+                padding: 5px 10px;
+                min-height: 22px;
+            }}
+            {selector}:focus {{
+                border: 1.5px solid {theme.hex.input_border_focus};
+            }}
+            {selector}:disabled {{
+                background-color: {theme.hex.disabled_background};
+                color: {theme.hex.disabled_text};
+            }}
+            {selector}::drop-down {{
+                subcontrol-origin: padding;
+                subcontrol-position: top right;
+                width: 25px;
+                border-left-width: 1px;
+                border-left-color: {theme.hex.separator};
+                border-left-style: solid;
+                border-top-right-radius: {BORDER_RADIUS};
+                border-bottom-right-radius: {BORDER_RADIUS};
+            }}
+            {selector}::down-arrow {{
+            }}
+            {selector} QCalendarWidget QWidget {{
+                background-color: {theme.hex.background_secondary};
+                color: {theme.hex.text_primary};
+                alternate-background-color: {theme.hex.background};
+            }}
+            {selector} QCalendarWidget QAbstractItemView {{
+                selection-background-color: {theme.hex.accent};
+                selection-color: white;
+            }}
+            {selector} QCalendarWidget QToolButton {{
+                color: {theme.hex.text_primary};
+                background-color: transparent;
+                border: none;
+                padding: 5px;
+                margin: 2px;
+                border-radius: {BORDER_RADIUS};
+            }}
+            {selector} QCalendarWidget QToolButton:hover {{
+                background-color: {theme.hex.separator};
+            }}
+            {selector} QCalendarWidget QToolButton:pressed {{
+                background-color: {theme.hex.accent_pressed};
+            }}
+            {selector} QCalendarWidget QMenu {{
+                background-color: {theme.hex.background_secondary};
+                color: {theme.hex.text_primary};
+                selection-background-color: {theme.hex.accent};
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleDateEdit")
+    def update_theme(self):
+        self._apply_style()
+
+register_application_style(AppleStyleDateEdit)
@@ -0,0 +1,84 @@
+"""Platform font families and the shared QFont factory."""
+import sys
+from PyQt6.QtGui import QFont, QFontDatabase
+
+# --- Fonts ---
+# Preferred families per platform; the first one installed wins.
+FONT_FAMILIES = {
+    "darwin": ["SF Pro Text", ".AppleSystemUIFont", "Helvetica Neue"],
+    "win32": ["Segoe UI", "Tahoma"],
+    "other": ["Noto Sans", "Cantarell", "DejaVu Sans", "Liberation Sans"],
+}
+
+# (point size, weight) per font role and platform
+FONT_ROLES = {
+    "body": {
+        "darwin": (14, QFont.Weight.Normal),
+        "win32": (10, QFont.Weight.Normal),
+        "other": (11, QFont.Weight.Normal),
+    },
+    "button": {
+        "darwin": (15, QFont.Weight.Medium),
+        "win32": (10, QFont.Weight.DemiBold),
+        "other": (11, QFont.Weight.Medium),
+    },
+}
+
+def _platform_key():
+    return sys.platform if sys.platform in ("darwin", "win32") else "other"
+
+class FontFactory:
+    """
+    Resolves the UI font family once through QFontDatabase and caches one QFont
+    per (role, size, weight), so widgets skip the family fallback search.
+    """
+    def __init__(self):
+        self._family = None
+        self._fonts = {}
+
+    def family(self):
+        if self._family is None:
+            installed = set(QFontDatabase.families())
+            for candidate in FONT_FAMILIES[_platform_key()]:
+                if candidate in installed:
+                    self._family = candidate
+                    break
+            else:
+                self._family = QFontDatabase.systemFont(QFontDatabase.SystemFont.GeneralFont).family()
+        return self._family
+
+    def font(self, role="body", size=None, weight=None):
+        # For the "label" role, size is the logical size and is scaled per platform
+        key = (role, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = self._build_font(role, size, weight)
+        return QFont(font) # Implicitly shared copy; callers may modify it freely
+
+    def _build_font(self, role, size, weight):
+        platform = _platform_key()
+        if role == "label":
+            point_size, default_weight = self._label_point_size(14 if size is None else size, platform), QFont.Weight.Normal
+        else:
+            point_size, default_weight = FONT_ROLES[role][platform]
+            if size is not None:
+                point_size = size
+        font = QFont(self.family())
+        font.setPointSize(point_size)
+        font.setWeight(default_weight if weight is None else weight)
+        return font
+
+    @staticmethod
+    def _label_point_size(font_size, platform):
+        if platform == "win32":
+            return int(font_size * 0.8) if font_size * 0.8 >= 9 else 9
+        if platform == "other":
+            return int(font_size * 0.9) if font_size * 0.9 >= 10 else 10
+        return font_size
+
+    def clear(self):
+        # Call after adding application fonts so the family is resolved again
+        self._family = None
+        self._fonts.clear()
+
+font_factory = FontFactory()
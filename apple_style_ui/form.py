@@ -0,0 +1,261 @@
+"""Declarative forms built from a dict/JSON spec in a single pass."""
+import json
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QButtonGroup
+from PyQt6.QtCore import Qt, QDate
+
+from . import styling
+from .styling import APPLICATION_STYLED_CLASSES, cached_stylesheet, application_stylesheet, shared_stylesheet_scope, theme_registry
+from .button import AppleStyleButton
+from .label import AppleStyleLabel
+from .line_edit import AppleStyleLineEdit
+from .text_edit import AppleStyleTextEdit, AppleStylePlainTextEdit
+from .check_box import AppleStyleCheckBox
+from .switch import AppleStyleSwitch
+from .slider import AppleStyleSlider
+from .radio_button import AppleStyleRadioButton
+from .combo_box import AppleStyleComboBox
+from .date_edit import AppleStyleDateEdit
+from .progress_bar import AppleStyleProgressBar
+
+# --- Field Types ---
+# type name -> (builder, label placement). A builder takes the field spec and the
+# parent widget and returns (widget, getter, setter, changed signal); getter/setter/changed may be
+# None. Placement is "above", "inline" (label left of the widget) or None when
+# the builder uses the spec's "label" itself.
+FIELD_TYPES = {}
+
+def register_field_type(name, builder, label="above"):
+    if label not in ("above", "inline", None):
+        raise ValueError(f"Unknown label placement: {label}")
+    FIELD_TYPES[name] = (builder, label)
+
+def _text(field):
+    return field.get("text", field.get("label", ""))
+
+def _build_label(field, parent):
+    widget = AppleStyleLabel(_text(field), parent, font_size=field.get("font_size", 14), is_secondary=field.get("secondary", False))
+    return widget, widget.text, widget.setText, None
+
+def _build_line_edit(field, parent):
+    widget = AppleStyleLineEdit(parent)
+    widget.setPlaceholderText(field.get("placeholder", ""))
+    return widget, widget.text, widget.setText, widget.textChanged
+
+def _build_text_edit(field, parent, widget_class=AppleStyleTextEdit):
+    widget = widget_class(parent)
+    widget.setPlaceholderText(field.get("placeholder", ""))
+    if "height" in field:
+        widget.setFixedHeight(field["height"])
+    return widget, widget.toPlainText, widget.setPlainText, widget.textChanged
+
+def _build_plain_text_edit(field, parent):
+    return _build_text_edit(field, parent, AppleStylePlainTextEdit)
+
+def _build_button(field, parent):
+    widget = AppleStyleButton(_text(field), parent, is_secondary=field.get("secondary", False))
+    return widget, None, None, widget.clicked
+
+def _build_check_box(field, parent):
+    widget = AppleStyleCheckBox(_text(field), parent)
+    return widget, widget.isChecked, widget.setChecked, widget.toggled
+
+def _build_switch(field, parent):
+    widget = AppleStyleSwitch(parent)
+    return widget, widget.isChecked, widget.setChecked, widget.toggled
+
+def _build_slider(field, parent):
+    widget = AppleStyleSlider(Qt.Orientation.Horizontal, parent)
+    widget.setRange(field.get("min", 0), field.get("max", 100))
+    return widget, widget.value, widget.setValue, widget.valueChanged
+
+def _build_radio(field, parent):
+    # The widget is a row of radio buttons; the value is the checked option's text
+    widget = QWidget(parent)
+    layout = QHBoxLayout(widget)
+    layout.setContentsMargins(0, 0, 0, 0)
+    group = QButtonGroup(widget)
+    for option in field.get("options", []):
+        button = AppleStyleRadioButton(option, widget)
+        group.addButton(button)
+        layout.addWidget(button)
+    layout.addStretch()
+
+    def value():
+        button = group.checkedButton()
+        return button.text() if button is not None else None
+
+    def set_value(text):
+        for button in group.buttons():
+            if button.text() == text:
+                button.setChecked(True)
+                return
+
+    return widget, value, set_value, group.buttonToggled
+
+def _build_combo_box(field, parent):
+    widget = AppleStyleComboBox(parent)
+    widget.addItems(field.get("options", []))
+    return widget, widget.currentText, widget.setCurrentText, widget.currentTextChanged
+
+def _build_date_edit(field, parent):
+    # Values are ISO "YYYY-MM-DD" strings so that specs and values() stay JSON-compatible
+    widget = AppleStyleDateEdit(parent)
+    getter = lambda: widget.date().toString(Qt.DateFormat.ISODate)
+    setter = lambda value: widget.setDate(QDate.fromString(value, Qt.DateFormat.ISODate))
+    return widget, getter, setter, widget.dateChanged
+
+def _build_progress_bar(field, parent):
+    widget = AppleStyleProgressBar(parent)
+    widget.setRange(field.get("min", 0), field.get("max", 100))
+    return widget, widget.value, widget.setValue, widget.valueChanged
+
+register_field_type("label", _build_label, label=None)
+register_field_type("line_edit", _build_line_edit)
+register_field_type("text_edit", _build_text_edit)
+register_field_type("plain_text_edit", _build_plain_text_edit)
+register_field_type("button", _build_button, label=None)
+register_field_type("check_box", _build_check_box, label=None)
+register_field_type("switch", _build_switch, label="inline")
+register_field_type("slider", _build_slider)
+register_field_type("radio", _build_radio)
+register_field_type("combo_box", _build_combo_box)
+register_field_type("date_edit", _build_date_edit)
+register_field_type("progress_bar", _build_progress_bar)
+
+class FormField:
+    """Handle to one named field: its widget, optional label and value accessors."""
+    __slots__ = ("name", "type", "widget", "label", "changed", "_getter", "_setter")
+
+    def __init__(self, name, field_type, widget, label, getter, setter, changed):
+        self.name = name
+        self.type = field_type
+        self.widget = widget
+        self.label = label
+        self.changed = changed
+        self._getter = getter
+        self._setter = setter
+
+    def value(self):
+        return self._getter() if self._getter is not None else None
+
+    def setValue(self, value):
+        if self._setter is None:
+            raise TypeError(f"Field {self.name!r} ({self.type}) has no value")
+        self._setter(value)
+
+    def __repr__(self):
+        return f"<FormField {self.name!r} {type(self.widget).__name__}>"
+
+class AppleStyleForm(QWidget):
+    """
+    A form built from a spec:
+
+        {"sections": [{"title": "Account", "fields": [
+            {"name": "user", "type": "line_edit", "label": "User name",
+             "placeholder": "...", "tooltip": "...", "default": "guest"},
+            ...]}]}
+
+    A spec may also list "fields" directly. Every field accepts "name", "type",
+    "label", "tooltip", "default" and "enabled"; see FIELD_TYPES for the types.
+    All fields share one stylesheet installed on the form, so a form costs one
+    stylesheet parse however many fields it has. Fields are created as
+    children of the form; build it in its final parent (as build_form does)
+    so that nothing is restyled by a later reparent.
+    """
+    SECTION_SPACING = 10 # Extra space above each section title
+
+    def __init__(self, spec, parent=None):
+        super().__init__(parent)
+        if isinstance(spec, str):
+            spec = json.loads(spec)
+        self.setObjectName("appleStyleForm")
+        self.fields = {}
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(18)
+
+        self.update_theme() # Before the fields exist, so each is styled once as it is created
+        sections = spec.get("sections", [])
+        if "fields" in spec:
+            sections = [{"fields": spec["fields"]}] + list(sections)
+        with shared_stylesheet_scope():
+            for index, section in enumerate(sections):
+                if section.get("title"):
+                    if index:
+                        self._layout.addSpacing(self.SECTION_SPACING)
+                    self._layout.addWidget(AppleStyleLabel(section["title"], self, font_size=16))
+                for field in section.get("fields", []):
+                    self._add_field(field)
+        theme_registry.register(self)
+
+    def _add_field(self, field):
+        field_type = field.get("type", "line_edit")
+        if field_type not in FIELD_TYPES:
+            raise ValueError(f"Unknown field type: {field_type}")
+        name = field.get("name")
+        if name is not None and name in self.fields:
+            raise ValueError(f"Duplicate field name: {name}")
+        builder, placement = FIELD_TYPES[field_type]
+        parent, layout, label = self, self._layout, None
+        if placement is not None and field.get("label"):
+            if placement == "inline":
+                # The row exists first so that the label and widget are created in their final parent
+                parent = QWidget(self)
+                self._layout.addWidget(parent)
+                layout = QHBoxLayout(parent)
+                layout.setContentsMargins(0, 0, 0, 0)
+            label = AppleStyleLabel(field["label"], parent)
+            layout.addWidget(label)
+            if placement == "inline":
+                layout.addStretch()
+        widget, getter, setter, changed = builder(field, parent)
+        layout.addWidget(widget)
+        if "tooltip" in field:
+            widget.setToolTip(field["tooltip"])
+        if "enabled" in field:
+            widget.setEnabled(field["enabled"])
+        if "default" in field and setter is not None:
+            setter(field["default"])
+
+        if name is not None:
+            self.fields[name] = FormField(name, field_type, widget, label, getter, setter, changed)
+
+    def __getitem__(self, name):
+        return self.fields[name]
+
+    def values(self):
+        return {name: field.value() for name, field in self.fields.items() if field._getter is not None}
+
+    def setValues(self, values):
+        for name, value in values.items():
+            self.fields[name].setValue(value)
+
+    @staticmethod
+    def _build_style(theme, styled_class_count):
+        # Plain containers stay transparent; the widget rules follow and take precedence.
+        # styled_class_count keys the cache so classes registered later are picked up.
+        return "QWidget { background-color: transparent; }" + application_stylesheet()
+
+    def update_theme(self):
+        if styling.STYLE_MODE == "application":
+            if self.styleSheet():
+                self.setStyleSheet("")
+        else:
+            self.setStyleSheet(cached_stylesheet(AppleStyleForm, self._build_style, len(APPLICATION_STYLED_CLASSES)))
+
+def build_form(spec, window=None):
+    """
+    Builds an AppleStyleForm from `spec` (a dict or JSON string). With `window`
+    (an AppleStyleWindow) the form is built in place in its content with
+    updates disabled, so the window lays out and repaints once.
+    """
+    if window is None:
+        return AppleStyleForm(spec)
+    window.setUpdatesEnabled(False)
+    try:
+        form = AppleStyleForm(spec, window.scroll_content_widget)
+        window.addContentWidget(form)
+    finally:
+        window.setUpdatesEnabled(True)
+    return form
@@ -0,0 +1,270 @@
+"""Item delegates and views that paint AppleStyle controls per model row."""
+from PyQt6.QtWidgets import (
+    QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem, QListView, QTableView,
+    QHeaderView, QAbstractItemView
+)
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtCore import Qt, QSize, QRect, QRectF, QPoint, QEvent
+
+from .theme import active_theme
+from .fonts import font_factory
+from .styling import BORDER_RADIUS, glyph_pixmap, apply_widget_stylesheet, register_application_style, theme_registry
+from .check_box import AppleStyleCheckBox
+from .switch import AppleStyleSwitch
+
+# --- Model/View ---
+def _is_checked(index):
+    value = index.data(Qt.ItemDataRole.CheckStateRole)
+    return value == Qt.CheckState.Checked or value == Qt.CheckState.Checked.value
+
+class AppleStyleItemDelegate(QStyledItemDelegate):
+    """
+    Paints item text with the AppleStyle palette and a uniform row height.
+    Base for the control delegates below, which paint AppleStyle controls
+    without creating a widget per item.
+    """
+    def __init__(self, parent=None, row_height=44):
+        super().__init__(parent)
+        self._row_height = row_height
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self._row_height)
+
+    def _paint_panel(self, painter, option, index):
+        # Background, selection and focus from the (style-sheeted) view style, without text or check box
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        opt.features &= ~QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+        style = opt.widget.style() if opt.widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+    def _paint_text(self, painter, option, index, rect):
+        theme = active_theme()
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if text is None:
+            return
+        painter.save()
+        if not option.state & QStyle.StateFlag.State_Enabled:
+            painter.setPen(theme.pen.disabled_text)
+        elif option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(QColor("white"))
+        else:
+            painter.setPen(theme.pen.text_primary)
+        painter.setFont(option.font)
+        elided = option.fontMetrics.elidedText(str(text), Qt.TextElideMode.ElideRight, rect.width())
+        painter.drawText(rect, int(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft), elided)
+        painter.restore()
+
+    def paint(self, painter, option, index):
+        self._paint_panel(painter, option, index)
+        self._paint_text(painter, option, index, option.rect.adjusted(10, 0, -10, 0))
+
+class _AppleStyleToggleDelegate(AppleStyleItemDelegate):
+    # Toggles Qt.CheckStateRole on a click inside the control or on Space/Select. The control
+    # is CONTROL_SIZE, vertically centred and inset 10px from the CONTROL_ALIGNMENT edge.
+    CONTROL_SIZE = QSize(18, 18)
+    CONTROL_ALIGNMENT = Qt.AlignmentFlag.AlignLeft
+
+    def _control_rect(self, option):
+        size = self.CONTROL_SIZE
+        if self.CONTROL_ALIGNMENT == Qt.AlignmentFlag.AlignRight:
+            left = option.rect.right() - 10 - size.width()
+        else:
+            left = option.rect.left() + 10
+        return QRect(left, option.rect.center().y() - size.height() // 2, size.width(), size.height())
+
+    def editorEvent(self, event, model, option, index):
+        flags = model.flags(index)
+        if not flags & Qt.ItemFlag.ItemIsUserCheckable or not flags & Qt.ItemFlag.ItemIsEnabled:
+            return False
+        if event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonDblClick, QEvent.Type.MouseButtonRelease):
+            if event.button() != Qt.MouseButton.LeftButton or not self._control_rect(option).contains(event.position().toPoint()):
+                return False
+            if event.type() != QEvent.Type.MouseButtonRelease:
+                return True # Swallow so that a click toggles exactly once
+        elif event.type() == QEvent.Type.KeyPress:
+            if event.key() not in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+                return False
+        else:
+            return False
+        state = Qt.CheckState.Unchecked if _is_checked(index) else Qt.CheckState.Checked
+        return model.setData(index, state, Qt.ItemDataRole.CheckStateRole)
+
+class AppleStyleCheckBoxDelegate(_AppleStyleToggleDelegate):
+    CONTROL_SIZE = QSize(18, 18)
+
+    def paint(self, painter, option, index):
+        self._paint_panel(painter, option, index)
+        theme = active_theme()
+        enabled = bool(option.state & QStyle.StateFlag.State_Enabled)
+        checked = _is_checked(index)
+        indicator_rect = self._control_rect(option)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if not enabled:
+            painter.setPen(theme.pen.separator)
+            painter.setBrush(theme.brush.disabled_background)
+        elif checked:
+            painter.setPen(theme.pen.accent)
+            painter.setBrush(theme.brush.accent)
+        else:
+            painter.setPen(theme.pen.input_border)
+            painter.setBrush(theme.brush.background_secondary)
+        painter.drawRoundedRect(QRectF(indicator_rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+        if checked:
+            painter.drawPixmap(indicator_rect.topLeft(), glyph_pixmap(
+                "checkmark", indicator_rect.size(), painter.device().devicePixelRatioF(), enabled,
+                AppleStyleCheckBox._render_checkmark))
+        painter.restore()
+
+        text_rect = option.rect.adjusted(indicator_rect.right() - option.rect.left() + 8, 0, -10, 0)
+        self._paint_text(painter, option, index, text_rect)
+
+class AppleStyleSwitchDelegate(_AppleStyleToggleDelegate):
+    CONTROL_SIZE = QSize(51, 31)
+    CONTROL_ALIGNMENT = Qt.AlignmentFlag.AlignRight
+
+    def paint(self, painter, option, index):
+        self._paint_panel(painter, option, index)
+        enabled = bool(option.state & QStyle.StateFlag.State_Enabled)
+        dpr = painter.device().devicePixelRatioF()
+        switch_rect = self._control_rect(option)
+        size = switch_rect.size()
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        if _is_checked(index):
+            track = glyph_pixmap("switch_track_on", size, dpr, enabled, AppleStyleSwitch._render_track_on)
+            handle_x = switch_rect.left() + size.width() - size.height() + 3
+        else:
+            track = glyph_pixmap("switch_track_off", size, dpr, enabled, AppleStyleSwitch._render_track_off)
+            handle_x = switch_rect.left() + 3
+        painter.drawPixmap(switch_rect.topLeft(), track)
+        handle_diameter = size.height() - 4
+        handle = glyph_pixmap("switch_handle", QSize(handle_diameter, handle_diameter), dpr, enabled,
+                              AppleStyleSwitch._render_handle)
+        painter.drawPixmap(QPoint(handle_x, switch_rect.top() + 2), handle)
+        painter.restore()
+
+        self._paint_text(painter, option, index, option.rect.adjusted(10, 0, -(size.width() + 20), 0))
+
+class AppleStyleProgressDelegate(AppleStyleItemDelegate):
+    """Paints Qt.DisplayRole (minimum..maximum) as an AppleStyleProgressBar-like bar."""
+    BAR_HEIGHT = 10
+
+    def __init__(self, parent=None, row_height=44, minimum=0, maximum=100):
+        super().__init__(parent, row_height)
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def paint(self, painter, option, index):
+        self._paint_panel(painter, option, index)
+        theme = active_theme()
+        try:
+            value = float(index.data(Qt.ItemDataRole.DisplayRole) or 0)
+        except (TypeError, ValueError):
+            value = self.minimum
+        span = self.maximum - self.minimum
+        fraction = min(max((value - self.minimum) / span, 0.0), 1.0) if span else 0.0
+
+        bar_rect = QRectF(option.rect.left() + 10, option.rect.center().y() - self.BAR_HEIGHT / 2,
+                          option.rect.width() - 20, self.BAR_HEIGHT)
+        radius = self.BAR_HEIGHT / 2
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(theme.brush.separator)
+        painter.drawRoundedRect(bar_rect, radius, radius)
+        if fraction > 0:
+            chunk_rect = QRectF(bar_rect.left(), bar_rect.top(), max(bar_rect.width() * fraction, self.BAR_HEIGHT), self.BAR_HEIGHT)
+            painter.setBrush(theme.brush.accent if option.state & QStyle.StateFlag.State_Enabled else theme.brush.disabled_text)
+            painter.drawRoundedRect(chunk_rect, radius, radius)
+        painter.restore()
+
+def _build_item_view_style(theme, selector):
+    return f"""
+        {selector} {{
+            background-color: {theme.hex.background_secondary};
+            color: {theme.hex.text_primary};
+            border: 1px solid {theme.hex.input_border};
+            border-radius: {BORDER_RADIUS};
+            selection-background-color: {theme.hex.accent};
+            selection-color: white;
+            outline: 0px;
+        }}
+        {selector}:disabled {{
+            background-color: {theme.hex.disabled_background};
+            color: {theme.hex.disabled_text};
+        }}
+        {selector} QHeaderView::section {{
+            background-color: {theme.hex.background};
+            color: {theme.hex.text_secondary};
+            border: none;
+            border-bottom: 1px solid {theme.hex.separator};
+            padding: 6px 10px;
+        }}
+    """
+
+class AppleStyleListView(QListView):
+    """List view with uniform row heights, painted by AppleStyleItemDelegate unless another delegate is set."""
+    def __init__(self, parent=None, row_height=44):
+        super().__init__(parent)
+        self.setFont(font_factory.font("body"))
+        self.setUniformItemSizes(True) # Row geometry is computed once, not per item
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setItemDelegate(AppleStyleItemDelegate(self, row_height))
+        self._apply_style()
+        theme_registry.register(self)
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleListView, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QListView"):
+        return _build_item_view_style(theme, selector)
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleListView")
+
+    def update_theme(self):
+        self._apply_style()
+        self.viewport().update()
+
+class AppleStyleTableView(QTableView):
+    """Table view with fixed, uniform row heights; use setItemDelegateForColumn for control columns."""
+    def __init__(self, parent=None, row_height=44):
+        super().__init__(parent)
+        self.setFont(font_factory.font("body"))
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        vertical_header = self.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed) # No per-row size queries
+        vertical_header.setDefaultSectionSize(row_height)
+        vertical_header.hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.setItemDelegate(AppleStyleItemDelegate(self, row_height))
+        self._apply_style()
+        theme_registry.register(self)
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleTableView, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QTableView"):
+        return _build_item_view_style(theme, selector)
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleTableView")
+
+    def update_theme(self):
+        self._apply_style()
+        self.viewport().update()
+
+register_application_style(AppleStyleListView)
+register_application_style(AppleStyleTableView)
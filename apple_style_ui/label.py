@@ -0,0 +1,45 @@
+"""Text labels."""
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt
+
+from .fonts import font_factory
+from .styling import apply_widget_stylesheet, set_style_property, register_application_style, theme_registry
+
+class AppleStyleLabel(QLabel):
+    def __init__(self, text, parent=None, font_size=14, is_secondary=False):
+        super().__init__(text, parent)
+        self.setFont(font_factory.font("label", font_size))
+
+        self.is_secondary = is_secondary
+        self._apply_style()
+        theme_registry.register(self)
+
+    def _apply_style(self):
+        set_style_property(self, "secondary", self.is_secondary)
+        apply_widget_stylesheet(self, AppleStyleLabel, self._build_style, self.is_secondary)
+
+    @staticmethod
+    def _build_style(theme, is_secondary, selector="QLabel"):
+        text_color_name = theme.hex.text_secondary if is_secondary else theme.hex.text_primary
+        return f"""
+            {selector} {{
+                color: {text_color_name};
+                background-color: transparent;
+                padding: 2px;
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, False, "AppleStyleLabel") + cls._build_style(theme, True, 'AppleStyleLabel[secondary="true"]')
+    def update_theme(self):
+        self._apply_style()
+
+class AppleStyleMessageLabel(AppleStyleLabel):
+    def __init__(self, parent=None):
+        super().__init__("", parent, font_size=12, is_secondary=True)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setFixedHeight(20)
+        self.hide()
+
+register_application_style(AppleStyleLabel)
@@ -0,0 +1,276 @@
+"""Single-line text input with off-thread handling of dropped paths."""
+import os
+import threading
+from PyQt6.QtWidgets import QLineEdit
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
+
+from .fonts import font_factory
+from .styling import BORDER_RADIUS, apply_widget_stylesheet, set_style_property, register_application_style, theme_registry
+
+def _default_path_validator(path):
+    # Returns None when the path is usable, otherwise the reason it was rejected
+    try:
+        os.stat(path)
+    except OSError as error:
+        return error.strerror or str(error)
+    return None
+
+class _PathBatchSignals(QObject):
+    results = pyqtSignal(int, list, list) # generation, accepted paths, [(path, reason)]
+    done = pyqtSignal(int) # generation
+
+class _PathIngestTask(QRunnable):
+    # Validates one dropped path, or every file below it when it is a directory
+    BATCH_SIZE = 64
+
+    def __init__(self, generation, path, validate, recursive, cancelled, signals):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.validate = validate
+        self.recursive = recursive
+        self.cancelled = cancelled
+        self.signals = signals
+
+    def _files(self):
+        if not (self.recursive and os.path.isdir(self.path)):
+            yield self.path
+            return
+        stack = [self.path]
+        while stack and not self.cancelled.is_set():
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            yield entry.path
+            except OSError:
+                continue
+
+    def run(self):
+        accepted, rejected = [], []
+        try:
+            for path in self._files():
+                if self.cancelled.is_set():
+                    return
+                reason = self.validate(path)
+                if reason is None:
+                    accepted.append(path)
+                else:
+                    rejected.append((path, reason))
+                if len(accepted) + len(rejected) >= self.BATCH_SIZE:
+                    self.signals.results.emit(self.generation, accepted, rejected)
+                    accepted, rejected = [], []
+            if accepted or rejected:
+                self.signals.results.emit(self.generation, accepted, rejected)
+        finally:
+            self.signals.done.emit(self.generation)
+
+class PathDropHandler(QObject):
+    """
+    Off-thread handling of paths dropped onto an AppleStyleLineEdit (see
+    setDropHandler). Each dropped path is checked, or enumerated when it is a
+    directory, on a QThreadPool; `validate(path)` runs on the worker and
+    returns None or a rejection reason. A new drop cancels the previous one.
+    """
+    pathsAccepted = pyqtSignal(list)
+    pathsRejected = pyqtSignal(list) # [(path, reason)]
+    ingestStarted = pyqtSignal()
+    ingestFinished = pyqtSignal(bool) # False when cancelled
+
+    def __init__(self, validate=None, recursive=True, max_threads=4, parent=None):
+        super().__init__(parent)
+        self._validate = validate or _default_path_validator
+        self._recursive = recursive
+        self._pool = QThreadPool(self) # Separate from the global pool so a slow mount cannot starve it
+        self._pool.setMaxThreadCount(max_threads)
+        self._signals = _PathBatchSignals(self)
+        self._signals.results.connect(self._on_results)
+        self._signals.done.connect(self._on_done)
+        self._generation = 0
+        self._cancelled = threading.Event()
+        self._pending_tasks = 0
+        self.accepted = []
+        self.rejected = []
+
+    def isBusy(self):
+        return self._pending_tasks > 0
+
+    def ingest(self, paths):
+        self.cancel()
+        self.accepted = []
+        self.rejected = []
+        self._pending_tasks = len(paths)
+        self.ingestStarted.emit()
+        for path in paths:
+            self._pool.start(_PathIngestTask(
+                self._generation, path, self._validate, self._recursive, self._cancelled, self._signals))
+        if not paths:
+            self.ingestFinished.emit(True)
+
+    def cancel(self):
+        # Queued tasks are discarded; running ones stop at their next file and
+        # their late results carry a stale generation
+        self._pool.clear()
+        self._cancelled.set()
+        self._cancelled = threading.Event()
+        self._generation += 1
+        if self._pending_tasks:
+            self._pending_tasks = 0
+            self.ingestFinished.emit(False)
+
+    def _on_results(self, generation, accepted, rejected):
+        if generation != self._generation:
+            return
+        if accepted:
+            self.accepted.extend(accepted)
+            self.pathsAccepted.emit(accepted)
+        if rejected:
+            self.rejected.extend(rejected)
+            self.pathsRejected.emit(rejected)
+
+    def _on_done(self, generation):
+        if generation != self._generation or not self._pending_tasks:
+            return
+        self._pending_tasks -= 1
+        if not self._pending_tasks:
+            self.ingestFinished.emit(True)
+
+class AppleStyleLineEdit(QLineEdit):
+    pathsDropped = pyqtSignal(list) # Every accepted path of a drop, once its handler has finished
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFont(font_factory.font("body"))
+        self._validation_state = "none" # "none", "error", "warning", "success"
+        self._apply_style()
+
+        self.setAcceptDrops(True)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.DefaultContextMenu)
+        self._drop_handler = None
+        self._drop_summary = "" # Shown in the tooltip below the application's own tooltip
+        self._tool_tip = ""
+        self.textEdited.connect(self._clear_drop_summary) # Typing replaces the dropped paths
+        theme_registry.register(self)
+
+
+    def setDropHandler(self, handler):
+        # With a PathDropHandler, drops accept every local path and are validated off the GUI thread
+        if self._drop_handler is not None:
+            self._drop_handler.cancel()
+            self._drop_handler.pathsAccepted.disconnect(self._show_dropped_paths)
+            self._drop_handler.pathsRejected.disconnect(self._show_dropped_paths)
+            self._drop_handler.ingestFinished.disconnect(self._finish_dropped_paths)
+        self._drop_handler = handler
+        if handler is not None:
+            handler.pathsAccepted.connect(self._show_dropped_paths)
+            handler.pathsRejected.connect(self._show_dropped_paths)
+            handler.ingestFinished.connect(self._finish_dropped_paths)
+
+    def dropHandler(self):
+        return self._drop_handler
+
+    def droppedPaths(self):
+        # Accepted paths of the last drop; the text shows only the first of them
+        return list(self._drop_handler.accepted) if self._drop_handler is not None else []
+
+    def setToolTip(self, text):
+        self._tool_tip = text
+        self._update_tool_tip()
+
+    def _update_tool_tip(self):
+        parts = [text for text in (self._tool_tip, self._drop_summary) if text]
+        super().setToolTip("\n".join(parts))
+
+    def _set_drop_summary(self, summary):
+        if summary != self._drop_summary:
+            self._drop_summary = summary
+            self._update_tool_tip()
+
+    def _clear_drop_summary(self, _text=None):
+        self._set_drop_summary("")
+
+    def _show_dropped_paths(self, _batch=None):
+        handler = self._drop_handler
+        if handler.accepted and self.text() != handler.accepted[0]:
+            self.setText(handler.accepted[0]) # Always a usable path; the rest are in droppedPaths()
+        summary = []
+        if len(handler.accepted) > 1:
+            summary.append(f"+{len(handler.accepted) - 1} more")
+        if handler.rejected:
+            if self._validation_state != "error":
+                self.setValidationState("error")
+            path, reason = handler.rejected[0]
+            summary.append(f"{len(handler.rejected)} rejected, e.g. {path}: {reason}")
+        self._set_drop_summary("\n".join(summary))
+
+    def _finish_dropped_paths(self, completed):
+        if completed:
+            if not self._drop_handler.rejected:
+                self.setValidationState("success")
+            self.pathsDropped.emit(list(self._drop_handler.accepted))
+
+    def setValidationState(self, state):
+        self._validation_state = state
+        self._apply_style()
+
+    def _apply_style(self):
+        set_style_property(self, "validationState", self._validation_state)
+        apply_widget_stylesheet(self, AppleStyleLineEdit, self._build_style, self._validation_state)
+
+    @staticmethod
+    def _build_style(theme, validation_state, selector="QLineEdit"):
+        border_color_name = theme.hex.input_border
+        if validation_state == "error":
+            border_color_name = theme.hex.input_border_error
+
+        return f"""
+            {selector} {{
+                background-color: {theme.hex.background_secondary};
+                color: {theme.hex.text_primary};
+                border: 1px solid {border_color_name};
+                border-radius: {BORDER_RADIUS};
+                padding: 8px 10px;
+                min-height: 22px;
+            }}
+            {selector}:focus {{
+                border: 1.5px solid {theme.hex.input_border_focus};
+            }}
+            {selector}:disabled {{
+                background-color: {theme.hex.disabled_background};
+                color: {theme.hex.disabled_text};
+                border-color: {theme.hex.separator};
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "none", "AppleStyleLineEdit") + \
+               cls._build_style(theme, "error", 'AppleStyleLineEdit[validationState="error"]')
+
+    def update_theme(self):
+        self._apply_style()
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event):
+        if self._drop_handler is not None:
+            paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+            if paths:
+                self.clear()
+                self._clear_drop_summary()
+                self.setValidationState("none")
+                self._drop_handler.ingest(paths)
+                event.acceptProposedAction()
+            return
+        for url in event.mimeData().urls():
+            if url.isLocalFile():
+                self.setText(url.toLocalFile())
+                break
+
+register_application_style(AppleStyleLineEdit)
@@ -0,0 +1,219 @@
+"""Opt-in counters and timings for the library's hot paths, with an optional HUD."""
+import functools
+import importlib
+import time
+from collections import deque
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtCore import Qt, QRectF, QTimer
+
+from .fonts import font_factory
+from .animation import animation_clock
+
+class _Stat:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self):
+        return {"count": self.count, "total_ms": self.total * 1000, "max_ms": self.max * 1000}
+
+class Instrumentation:
+    """
+    Counts and times `_apply_style`, `setStyleSheet` and `paintEvent` per
+    widget class, animation clock frames, and AppleStyleWindow.set_theme.
+
+    enable() wraps those methods on every AppleStyle widget class (importing
+    all widget modules first) and disable() restores the originals, so a
+    disabled build runs the unmodified methods and pays nothing. Subclasses
+    inherit the wrappers and are reported under their own class names.
+    set_theme times the synchronous restyle; the repaint that follows is
+    counted under paintEvent.
+    """
+    CATEGORIES = ("apply_style", "set_style_sheet", "paint", "set_theme")
+    FPS_WINDOW_S = 1.0 # Frames counted over this trailing window
+
+    def __init__(self):
+        self._patched = [] # (class, attribute name, original or None)
+        self._frame_times = deque(maxlen=1024)
+        self._stats = {category: {} for category in self.CATEGORIES} # category -> class name -> _Stat
+        self.frames = 0
+
+    def isEnabled(self):
+        return bool(self._patched)
+
+    def reset(self):
+        # Cleared in place: the installed wrappers hold these dicts
+        for per_class in self._stats.values():
+            per_class.clear()
+        self._frame_times.clear()
+        self.frames = 0
+
+    def enable(self):
+        if self._patched:
+            return
+        from . import _EXPORTS
+        for module_name in set(_EXPORTS.values()):
+            importlib.import_module(f".{module_name}", __package__)
+
+        for cls in self._widget_classes():
+            for name, category in (("_apply_style", "apply_style"), ("paintEvent", "paint")):
+                if name in cls.__dict__:
+                    self._wrap(cls, name, category)
+            if not any(base.__module__.startswith(f"{__package__}.") for base in cls.__mro__[1:]):
+                self._wrap(cls, "setStyleSheet", "set_style_sheet") # Once per hierarchy; subclasses inherit it
+        from .window import AppleStyleWindow
+        self._wrap(AppleStyleWindow, "set_theme", "set_theme")
+        animation_clock._ensure_timer().timeout.connect(self._count_frame)
+
+    def disable(self):
+        if not self._patched:
+            return
+        animation_clock._ensure_timer().timeout.disconnect(self._count_frame)
+        for cls, name, original in reversed(self._patched):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._patched.clear()
+
+    @staticmethod
+    def _widget_classes():
+        classes, pending = [], list(QWidget.__subclasses__())
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            if cls.__module__.startswith(f"{__package__}.") and cls is not InstrumentationHUD:
+                classes.append(cls)
+        return classes
+
+    def _wrap(self, cls, name, category):
+        original = cls.__dict__.get(name)
+        method = getattr(cls, name)
+        stats = self._stats
+
+        @functools.wraps(method)
+        def timed(widget, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(widget, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                per_class = stats[category]
+                class_name = type(widget).__name__
+                stat = per_class.get(class_name)
+                if stat is None:
+                    stat = per_class[class_name] = _Stat()
+                stat.record(elapsed)
+
+        setattr(cls, name, timed)
+        self._patched.append((cls, name, original))
+
+    def _count_frame(self):
+        self.frames += 1
+        self._frame_times.append(time.perf_counter())
+
+    def fps(self):
+        # Animation clock frames per second over the last FPS_WINDOW_S
+        now = time.perf_counter()
+        return sum(1 for stamp in self._frame_times if now - stamp <= self.FPS_WINDOW_S) / self.FPS_WINDOW_S
+
+    def snapshot(self):
+        """
+        Returns {category: {class name: {"count", "total_ms", "max_ms"}}} for the
+        CATEGORIES, plus "animation": {"frames", "fps"}.
+        """
+        result = {category: {name: stat.as_dict() for name, stat in per_class.items()}
+                  for category, per_class in self._stats.items()}
+        result["animation"] = {"frames": self.frames, "fps": self.fps()}
+        return result
+
+    def report(self, limit=10):
+        """Text table of the classes with the highest total time in each category."""
+        lines = [f"animation: {self.frames} frames, {self.fps():.1f} fps"]
+        for category, per_class in self._stats.items():
+            if not per_class:
+                continue
+            lines.append(f"{category}:")
+            ranked = sorted(per_class.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+            for name, stat in ranked:
+                lines.append(f"  {name:<32} {stat.count:>8} calls {stat.total * 1000:>10.1f} ms total {stat.max * 1000:>8.2f} ms max")
+        return "\n".join(lines)
+
+    def top(self, category, limit=3):
+        # [(class name, stat)] with the highest total time; stat has count, total and max (seconds)
+        per_class = self._stats[category]
+        return sorted(per_class.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+
+instrumentation = Instrumentation()
+
+class InstrumentationHUD(QWidget):
+    """
+    Overlay in the top-right corner of `parent` showing the animation frame
+    rate, the mean set_theme latency and the most expensive classes. It reads
+    the counters every REFRESH_MS and is itself not instrumented.
+    """
+    REFRESH_MS = 500
+    MARGIN = 12
+
+    def __init__(self, parent, source=instrumentation):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setFont(font_factory.font("label", 11))
+        self._source = source
+        self._lines = []
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(self.REFRESH_MS)
+        parent.installEventFilter(self)
+        self.refresh()
+        self.show()
+        self.raise_()
+
+    def _collect_lines(self):
+        source = self._source
+        header = f"{source.fps():.0f} fps"
+        for _, stat in source.top("set_theme", 1):
+            header += f" · set_theme {stat.total / stat.count * 1000:.1f} ms avg ({stat.count}×)"
+        if not source.isEnabled():
+            header += " · instrumentation off"
+        lines = [header]
+        for label, category in (("paint", "paint"), ("style", "apply_style"), ("sheet", "set_style_sheet")):
+            for name, stat in source.top(category):
+                lines.append(f"{label} {name} {stat.count}× {stat.total * 1000:.1f} ms")
+        return lines
+
+    def refresh(self):
+        self._lines = self._collect_lines()
+        metrics = self.fontMetrics()
+        width = max(metrics.horizontalAdvance(line) for line in self._lines) + 16
+        height = metrics.height() * len(self._lines) + 12
+        parent = self.parentWidget()
+        self.setGeometry(parent.width() - width - self.MARGIN, self.MARGIN, width, height)
+        self.update()
+
+    def eventFilter(self, obj, event):
+        if event.type() == event.Type.Resize:
+            self.refresh()
+        return False
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 180))
+        painter.drawRoundedRect(QRectF(self.rect()), 6, 6)
+        painter.setPen(QColor("white"))
+        line_height = self.fontMetrics().height()
+        for index, line in enumerate(self._lines):
+            painter.drawText(8, 6 + index * line_height + self.fontMetrics().ascent(), line)
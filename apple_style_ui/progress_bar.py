@@ -0,0 +1,152 @@
+"""Progress bar and its thread-safe reporter."""
+import math
+import threading
+from PyQt6.QtWidgets import QProgressBar
+from PyQt6.QtCore import Qt, QElapsedTimer, pyqtSignal, QTimer, QObject
+
+from .styling import apply_widget_stylesheet, register_application_style, theme_registry
+from .animation import animation_clock
+
+def _format_duration(seconds):
+    seconds = int(seconds + 0.5)
+    if seconds >= 3600:
+        return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+class ProgressReporter(QObject):
+    """
+    Thread-safe, coalescing progress updates for an AppleStyleProgressBar.
+    report() may be called from any thread at any rate: it only stores the
+    latest value under a lock, and at most one queued signal is in flight. The
+    bar is updated at most once per animation_clock frame, and the last reported
+    value is always applied. Rate and ETA are estimated from the applied samples
+    and emitted through statsChanged; with a `label` they are also shown there.
+    """
+    statsChanged = pyqtSignal(float, float) # units per second, seconds remaining (-1 when unknown)
+    _pending = pyqtSignal()
+
+    RATE_SMOOTHING = 0.3 # Weight of the newest sample in the moving-average rate
+
+    def __init__(self, progress_bar, label=None):
+        super().__init__(progress_bar)
+        self._bar = progress_bar
+        self._label = label
+        self._lock = threading.Lock()
+        self._value = None
+        self._maximum = None
+        self._signalled = False
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._last_apply_ms = None
+        self._rate_sample = None # (ms, value) of the previous applied update
+        self.rate = 0.0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._apply)
+        self._pending.connect(self._schedule, Qt.ConnectionType.QueuedConnection)
+
+    def report(self, value, maximum=None):
+        # Safe to call from any thread
+        with self._lock:
+            self._value = value
+            if maximum is not None:
+                self._maximum = maximum
+            if self._signalled:
+                return
+            self._signalled = True
+        self._pending.emit()
+
+    def reset(self):
+        with self._lock:
+            self._value = None
+        self._rate_sample = None
+        self.rate = 0.0
+        self._bar.reset()
+
+    def _schedule(self):
+        interval = 1000 / animation_clock.frame_rate()
+        if self._last_apply_ms is None:
+            self._apply()
+            return
+        wait = interval - (self._clock.elapsed() - self._last_apply_ms)
+        if wait <= 0:
+            self._apply()
+        elif not self._flush_timer.isActive():
+            self._flush_timer.start(math.ceil(wait))
+
+    def _apply(self):
+        with self._lock:
+            value, maximum = self._value, self._maximum
+            self._maximum = None
+            self._signalled = False # Reports from here on schedule another apply
+        now = self._clock.elapsed()
+        self._last_apply_ms = now
+        if maximum is not None:
+            self._bar.setMaximum(maximum)
+        if value is None:
+            return
+        self._bar.setValue(int(value))
+        self._update_stats(now, value)
+
+    def _update_stats(self, now, value):
+        previous = self._rate_sample
+        self._rate_sample = (now, value)
+        if previous is None or now <= previous[0]:
+            return
+        rate = (value - previous[1]) * 1000 / (now - previous[0])
+        self.rate = rate if not self.rate else self.rate + self.RATE_SMOOTHING * (rate - self.rate)
+        remaining = self._bar.maximum() - value
+        eta = remaining / self.rate if self.rate > 0 else -1.0
+        self.statsChanged.emit(self.rate, eta)
+        if self._label is not None:
+            text = f"{self.rate:,.0f}/s"
+            if remaining <= 0:
+                text += " · done"
+            elif eta >= 0:
+                text += f" · {_format_duration(eta)} remaining"
+            self._label.setText(text)
+
+class AppleStyleProgressBar(QProgressBar):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimum(0)
+        self.setMaximum(100)
+        self.setTextVisible(False)
+        self._reporter = None
+        self._apply_style()
+        theme_registry.register(self)
+
+    def reporter(self, label=None):
+        # Thread-safe reporting API; see ProgressReporter
+        if self._reporter is None:
+            self._reporter = ProgressReporter(self, label)
+        elif label is not None:
+            self._reporter._label = label
+        return self._reporter
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleProgressBar, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QProgressBar"):
+        return f"""
+            {selector} {{
+                border: none;
+                border-radius: 5px;
+                background-color: {theme.hex.separator};
+                height: 10px;
+            }}
+            {selector}::chunk {{
+                background-color: {theme.hex.accent};
+                border-radius: 5px;
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleProgressBar")
+
+    def update_theme(self):
+        self._apply_style()
+
+register_application_style(AppleStyleProgressBar)
@@ -0,0 +1,99 @@
+"""Radio button with a cached dot glyph."""
+from PyQt6.QtWidgets import QRadioButton, QStyleOptionButton, QStyle
+from PyQt6.QtGui import QPainter
+from PyQt6.QtCore import Qt, QRectF, QEvent
+
+from .fonts import font_factory
+from .styling import glyph_pixmap, apply_widget_stylesheet, register_application_style, theme_registry
+
+class AppleStyleRadioButton(QRadioButton):
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self._cached_indicator_rect = None
+        self.setFont(font_factory.font("body"))
+        self._apply_style()
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        theme_registry.register(self)
+
+
+    def wheelEvent(self, event):
+        if self.hasFocus():
+            super().wheelEvent(event)
+        else:
+            event.ignore()
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleRadioButton, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QRadioButton"):
+        return f"""
+            {selector} {{
+                spacing: 8px;
+                color: {theme.hex.text_primary};
+            }}
+            {selector}::indicator {{
+                width: 18px;
+                height: 18px;
+                border: 1px solid {theme.hex.input_border};
+                border-radius: 9px;
+                background-color: {theme.hex.background_secondary};
+            }}
+            {selector}::indicator:checked {{
+                background-color: {theme.hex.background_secondary};
+                border: 1px solid {theme.hex.accent};
+            }}
+            {selector}::indicator:disabled {{
+                background-color: {theme.hex.disabled_background};
+                border: 1px solid {theme.hex.separator};
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleRadioButton")
+
+    def _indicator_rect(self):
+        # Cached until the geometry, style, font or layout direction changes
+        if self._cached_indicator_rect is None:
+            opt = QStyleOptionButton()
+            self.initStyleOption(opt)
+            self._cached_indicator_rect = self.style().subElementRect(QStyle.SubElement.SE_RadioButtonIndicator, opt, self)
+        return self._cached_indicator_rect
+
+    def resizeEvent(self, event):
+        self._cached_indicator_rect = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.FontChange, QEvent.Type.LayoutDirectionChange):
+            self._cached_indicator_rect = None
+        super().changeEvent(event)
+
+    @staticmethod
+    def _render_dot(painter, indicator_rect, theme, enabled):
+        dot_diameter = indicator_rect.width() / 2.5
+        dot_rect = QRectF(
+            (indicator_rect.width() - dot_diameter) / 2 + indicator_rect.x(),
+            (indicator_rect.height() - dot_diameter) / 2 + indicator_rect.y(),
+            dot_diameter, dot_diameter
+        )
+        painter.setBrush(theme.brush.accent if enabled else theme.brush.disabled_text)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(dot_rect)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.isChecked():
+            indicator_rect = self._indicator_rect()
+            pixmap = glyph_pixmap("radio_dot", indicator_rect.size(), self.devicePixelRatioF(),
+                                  self.isEnabled(), self._render_dot)
+            painter = QPainter(self)
+            painter.drawPixmap(indicator_rect.topLeft(), pixmap)
+            painter.end()
+
+    def update_theme(self):
+        self._apply_style()
+        self.update() # Ensure repaint for the custom dot
+
+register_application_style(AppleStyleRadioButton)
@@ -0,0 +1,102 @@
+"""Bounded LRU cache of pre-rendered pixmaps for custom-painted elements."""
+import math
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtCore import Qt, QRect, QPoint
+
+from .theme import active_theme
+
+class RenderCache:
+    """
+    Pixmaps keyed by (name, logical size, devicePixelRatio, theme, state),
+    rendered at device resolution so that painting one is a blit on any
+    screen. The least recently used pixmaps are evicted once the cache holds
+    more than `limit_bytes`.
+
+    Entries for other themes are dropped when the theme changes (see
+    ThemeRegistry.apply_theme), and entries for device pixel ratios no shown
+    window uses are dropped when a window changes screens (see
+    AppleStyleWindow), so a mixed-DPI session only keeps what it can draw.
+    """
+    def __init__(self, limit_bytes=8 * 1024 * 1024):
+        self._limit = limit_bytes
+        self._entries = OrderedDict() # key -> QPixmap, least recently used first
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def limit(self):
+        return self._limit
+
+    def setLimit(self, limit_bytes):
+        self._limit = limit_bytes
+        self._evict()
+
+    def bytes(self):
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {"entries": len(self._entries), "bytes": self._bytes, "limit": self._limit,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def pixmap(self, name, size, device_pixel_ratio, render, *state):
+        """
+        Returns the cached pixmap for `name` at `size` (logical pixels),
+        calling render(painter, rect, theme, *state) on a miss.
+        """
+        theme = active_theme()
+        key = (name, size.width(), size.height(), device_pixel_ratio, theme.name) + state
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pixmap
+
+        self.misses += 1
+        pixmap = QPixmap(math.ceil(size.width() * device_pixel_ratio), math.ceil(size.height() * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        render(painter, QRect(QPoint(0, 0), size), theme, *state)
+        painter.end()
+
+        self._entries[key] = pixmap
+        self._bytes += self._cost(pixmap)
+        self._evict()
+        return pixmap
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def _evict(self):
+        while self._bytes > self._limit and self._entries:
+            _, pixmap = self._entries.popitem(last=False)
+            self._bytes -= self._cost(pixmap)
+            self.evictions += 1
+
+    def _discard(self, predicate):
+        for key in [key for key in self._entries if predicate(key)]:
+            self._bytes -= self._cost(self._entries.pop(key))
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def retain_theme(self, theme_name):
+        self._discard(lambda key: key[4] != theme_name)
+
+    def retain_device_pixel_ratios(self, ratios=None):
+        # By default, the ratios of the application's visible top-level windows
+        if ratios is None:
+            ratios = {widget.devicePixelRatioF() for widget in QApplication.topLevelWidgets() if widget.isVisible()}
+        self._discard(lambda key: key[3] not in ratios)
+
+render_cache = RenderCache()
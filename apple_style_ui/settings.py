@@ -0,0 +1,102 @@
+"""Debounced, off-thread QSettings persistence."""
+import threading
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QSettings, QTimer, QObject
+
+class _SettingsWriter:
+    # Applies batches of {key: value} to its own QSettings and syncs, in order, off the GUI thread.
+    # The thread exits once the queue is empty; it is not a daemon, so pending writes finish at exit.
+    def __init__(self, organization, application):
+        self.organization = organization
+        self.application = application
+        self._batches = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, batch):
+        with self._lock:
+            self._batches.append(batch)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="AppleStyleSettingsWriter")
+                self._thread.start()
+
+    def wait(self):
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        settings = QSettings(QSettings.Format.IniFormat, QSettings.Scope.UserScope, self.organization, self.application)
+        while True:
+            with self._lock:
+                if not self._batches:
+                    self._thread = None
+                    return
+                batch = self._batches.pop(0)
+            for key, value in batch.items():
+                settings.setValue(key, value)
+            settings.sync()
+
+class SettingsStore(QObject):
+    """
+    QSettings front end with dirty tracking and debounced, off-thread writes.
+    setValue() only records the change; markDirty() records a getter that is
+    read once at flush time, so frequently changing state (geometry, scroll
+    position, long text) costs nothing per change. DEBOUNCE_MS after the last
+    change the batch is written and synced on a background thread. flush(wait=True)
+    runs on close and when the application is about to quit.
+    """
+    DEBOUNCE_MS = 500
+
+    def __init__(self, organization, application, parent=None):
+        super().__init__(parent)
+        self.settings = QSettings(QSettings.Format.IniFormat, QSettings.Scope.UserScope, organization, application)
+        self._values = {} # Values written this session; they win over the possibly stale QSettings cache
+        self._dirty = {} # key -> value, or getter to call at flush time
+        self._writer = _SettingsWriter(organization, application)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_on_quit)
+
+    def value(self, key, default=None, type=None):
+        if key in self._dirty:
+            pending = self._dirty[key]
+            return pending() if callable(pending) else pending
+        if key in self._values:
+            return self._values[key]
+        if type is None:
+            return self.settings.value(key, default)
+        return self.settings.value(key, default, type=type)
+
+    def contains(self, key):
+        return key in self._dirty or key in self._values or self.settings.contains(key)
+
+    def setValue(self, key, value):
+        if key not in self._dirty and self._values.get(key, self.settings.value(key)) == value:
+            return # Unchanged; nothing to write
+        self._dirty[key] = value
+        self._timer.start(self.DEBOUNCE_MS)
+
+    def markDirty(self, key, getter):
+        self._dirty[key] = getter
+        self._timer.start(self.DEBOUNCE_MS)
+
+    def flush(self, wait=False):
+        self._timer.stop()
+        if self._dirty:
+            batch = {}
+            for key, pending in self._dirty.items():
+                value = pending() if callable(pending) else pending
+                if self._values.get(key) != value:
+                    batch[key] = self._values[key] = value
+            self._dirty.clear()
+            if batch:
+                self._writer.submit(batch)
+        if wait:
+            self._writer.wait()
+
+    def _flush_on_quit(self):
+        self.flush(wait=True)
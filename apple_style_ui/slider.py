@@ -0,0 +1,79 @@
+"""Horizontal and vertical sliders."""
+from PyQt6.QtWidgets import QSlider
+from PyQt6.QtCore import Qt
+
+from .styling import apply_widget_stylesheet, register_application_style, theme_registry
+
+class AppleStyleSlider(QSlider):
+    def __init__(self, orientation, parent=None):
+        super().__init__(orientation, parent)
+        self._apply_style()
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        theme_registry.register(self)
+
+    def wheelEvent(self, event):
+        # print(f"AppleStyleSlider wheelEvent: hasFocus() = {self.hasFocus()}")
+        if self.hasFocus():
+            # print("AppleStyleSlider: Processing wheel event")
+            super().wheelEvent(event)
+        else:
+            # print("AppleStyleSlider: Ignoring wheel event")
+            event.ignore()
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleSlider, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QSlider"):
+        return f"""
+            {selector}::groove:horizontal {{
+                border: 1px solid {theme.hex.separator};
+                height: 4px;
+                background: {theme.hex.separator};
+                margin: 2px 0;
+                border-radius: 2px;
+            }}
+            {selector}::handle:horizontal {{
+                background: {theme.hex.background_secondary};
+                border: 1px solid {theme.hex.separator};
+                width: 28px;
+                height: 28px;
+                margin: -12px 0;
+                border-radius: 14px;
+            }}
+            {selector}::sub-page:horizontal {{
+                background: {theme.hex.accent};
+                border: 1px solid {theme.hex.accent};
+                height: 4px;
+                border-radius: 2px;
+            }}
+            {selector}::groove:vertical {{
+                border: 1px solid {theme.hex.separator};
+                width: 4px;
+                background: {theme.hex.separator};
+                margin: 0 2px;
+                border-radius: 2px;
+            }}
+            {selector}::handle:vertical {{
+                background: {theme.hex.background_secondary};
+                border: 1px solid {theme.hex.separator};
+                width: 28px;
+                height: 28px;
+                margin: 0 -12px;
+                border-radius: 14px;
+            }}
+            {selector}::sub-page:vertical {{
+                background: {theme.hex.accent};
+                border: 1px solid {theme.hex.accent};
+                width: 4px;
+                border-radius: 2px;
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleSlider")
+    def update_theme(self):
+        self._apply_style()
+
+register_application_style(AppleStyleSlider)
@@ -0,0 +1,175 @@
+"""Stylesheet and glyph caches, style modes and the registry of themed widgets."""
+import weakref
+from contextlib import contextmanager
+from PyQt6 import sip
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QObject, QEvent
+
+from .theme import _THEME_REGISTERED_CALLBACKS, active_theme
+from .rendering import render_cache
+
+BORDER_RADIUS_PX = 8
+BORDER_RADIUS = f"{BORDER_RADIUS_PX}px"
+
+# --- Stylesheet Cache ---
+# Widgets with the same class, theme and state share one compiled stylesheet
+# string instead of formatting their own on every _apply_style().
+_STYLESHEET_CACHE = {}
+
+def cached_stylesheet(widget_class, builder, *state):
+    theme = active_theme()
+    key = (widget_class, theme.name) + state
+    stylesheet = _STYLESHEET_CACHE.get(key)
+    if stylesheet is None:
+        stylesheet = _STYLESHEET_CACHE[key] = builder(theme, *state)
+    return stylesheet
+
+def invalidate_stylesheet_cache():
+    _STYLESHEET_CACHE.clear()
+    if STYLE_MODE == "application":
+        apply_application_stylesheet()
+
+# --- Glyph Cache ---
+# Custom-painted glyphs (checkmark, radio dot, switch parts) live in the shared
+# render cache, keyed by (glyph, size, devicePixelRatio, theme, enabled), so a
+# repaint of a checked control is a single blit.
+def glyph_pixmap(glyph, size, device_pixel_ratio, enabled, render):
+    return render_cache.pixmap(glyph, size, device_pixel_ratio, render, enabled)
+
+def invalidate_glyph_cache():
+    render_cache.clear()
+
+# --- Style Mode ---
+# "widget": every widget installs its own (cached) stylesheet.
+# "application": one compiled stylesheet is installed on QApplication and
+# per-instance variations are dynamic properties matched by property selectors,
+# so a theme switch is a single setStyleSheet call.
+STYLE_MODE = "widget"
+
+def set_style_mode(mode):
+    # Call before creating widgets; existing widgets keep their local stylesheets.
+    global STYLE_MODE
+    if mode not in ("widget", "application"):
+        raise ValueError(f"Unknown style mode: {mode}")
+    STYLE_MODE = mode
+    app = QApplication.instance()
+    if mode == "application":
+        apply_application_stylesheet()
+    elif app is not None and app.styleSheet():
+        app.setStyleSheet("")
+
+# Widgets created inside shared_stylesheet_scope() take their rules from one
+# stylesheet on an ancestor (see form.AppleStyleForm) instead of their own, as in
+# application mode. They must stay inside that ancestor to keep their style.
+_shared_scope_depth = 0
+
+@contextmanager
+def shared_stylesheet_scope():
+    global _shared_scope_depth
+    _shared_scope_depth += 1
+    try:
+        yield
+    finally:
+        _shared_scope_depth -= 1
+
+def uses_shared_stylesheet(widget):
+    if STYLE_MODE == "application":
+        return True
+    if _shared_scope_depth:
+        widget._shared_stylesheet = True
+        return True
+    return getattr(widget, "_shared_stylesheet", False)
+
+def apply_widget_stylesheet(widget, widget_class, builder, *state):
+    if uses_shared_stylesheet(widget):
+        return # Covered by the application (or an ancestor's shared) stylesheet
+    widget.setStyleSheet(cached_stylesheet(widget_class, builder, *state))
+
+def set_style_property(widget, name, value):
+    # Dynamic properties only take effect on a polished widget after a re-polish.
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    if uses_shared_stylesheet(widget) and widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        widget.update()
+
+# Widget modules add their classes on import, so the application stylesheet only
+# carries rules for widgets that can exist.
+APPLICATION_STYLED_CLASSES = []
+
+def register_application_style(widget_class):
+    # widget_class._build_application_style(theme) returns the class's rules
+    APPLICATION_STYLED_CLASSES.append(widget_class)
+    for key in [key for key in _STYLESHEET_CACHE if key[0] is QApplication]:
+        del _STYLESHEET_CACHE[key]
+    if STYLE_MODE == "application":
+        apply_application_stylesheet()
+
+def application_stylesheet():
+    return cached_stylesheet(QApplication, _build_application_stylesheet)
+
+def _build_application_stylesheet(theme):
+    return "".join(widget_class._build_application_style(theme) for widget_class in APPLICATION_STYLED_CLASSES)
+
+def apply_application_stylesheet():
+    app = QApplication.instance()
+    if app is None:
+        return
+    stylesheet = application_stylesheet()
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
+
+# --- Theme Registry ---
+class ThemeRegistry(QObject):
+    """
+    Tracks every themed widget through weak references so that a theme change
+    reaches all of them, however deeply nested and in whichever window.
+    Hidden widgets are restyled lazily on their next show.
+    """
+    def __init__(self):
+        super().__init__()
+        self._widgets = weakref.WeakSet()
+        self._stale_widgets = weakref.WeakSet() # Hidden widgets waiting for their next show
+
+    def register(self, widget):
+        self._widgets.add(widget)
+
+    def unregister(self, widget):
+        self._widgets.discard(widget)
+        self._stale_widgets.discard(widget)
+
+    def widgets(self):
+        return [widget for widget in list(self._widgets) if not sip.isdeleted(widget)]
+
+    def apply_theme(self):
+        if STYLE_MODE == "application":
+            apply_application_stylesheet()
+        render_cache.retain_theme(active_theme().name) # Pixmaps of the previous theme are not drawn again
+
+        widgets = self.widgets()
+        windows = {widget.window() for widget in widgets if widget.isVisible()}
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        try:
+            for widget in widgets:
+                if widget.isVisible():
+                    widget.update_theme()
+                elif widget not in self._stale_widgets:
+                    self._stale_widgets.add(widget)
+                    widget.installEventFilter(self)
+        finally:
+            for window in windows:
+                window.setUpdatesEnabled(True) # Schedules one repaint of the whole window
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Show and obj in self._stale_widgets:
+            self._stale_widgets.discard(obj)
+            obj.removeEventFilter(self)
+            obj.update_theme()
+        return False
+
+theme_registry = ThemeRegistry()
+
+_THEME_REGISTERED_CALLBACKS.extend((invalidate_stylesheet_cache, invalidate_glyph_cache))
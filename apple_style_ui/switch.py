@@ -0,0 +1,105 @@
+"""Toggle switch painted from cached pixmaps."""
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtCore import Qt, pyqtProperty, QSize, QRectF, QPointF, pyqtSignal
+
+from .styling import glyph_pixmap, theme_registry
+from .animation import animation_clock
+
+class AppleStyleSwitch(QWidget):
+    toggled = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(51, 31)
+        self._checked = False
+        self._circle_position = 3.0
+
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.update_theme()
+        theme_registry.register(self)
+
+    @pyqtProperty(float)
+    def circlePosition(self):
+        return self._circle_position
+
+    @circlePosition.setter
+    def circlePosition(self, pos):
+        self._circle_position = pos
+        self.update()
+
+    def isChecked(self):
+        return self._checked
+
+    def setChecked(self, checked):
+        if self._checked == checked:
+            return
+        self._checked = checked
+        self._start_animation()
+        self.toggled.emit(self._checked)
+        self.update()
+
+    def _handle_range(self):
+        return 3.0, float(self.width() - self.height() + 3) # Off and on positions of the handle
+
+    def _start_animation(self):
+        current_pos = self.circlePosition
+        off_pos, on_pos = self._handle_range()
+        target_pos = on_pos if self._checked else off_pos
+        animation_clock.animate(self, "circlePosition", current_pos, target_pos)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.setChecked(not self.isChecked())
+        super().mousePressEvent(event)
+
+    @staticmethod
+    def _render_track(painter, track_rect, color):
+        painter.setBrush(color)
+        painter.setPen(Qt.PenStyle.NoPen)
+        track_radius = track_rect.height() / 2
+        painter.drawRoundedRect(QRectF(track_rect), track_radius, track_radius)
+
+    @staticmethod
+    def _render_track_off(painter, track_rect, theme, enabled):
+        AppleStyleSwitch._render_track(painter, track_rect, theme.brush.separator if enabled else theme.brush.disabled_background)
+
+    @staticmethod
+    def _render_track_on(painter, track_rect, theme, enabled):
+        AppleStyleSwitch._render_track(painter, track_rect, theme.brush.accent if enabled else theme.brush.disabled_text)
+
+    @staticmethod
+    def _render_handle(painter, handle_rect, theme, enabled):
+        painter.setBrush(QColor("white"))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(QRectF(handle_rect))
+
+    def paintEvent(self, event):
+        # Track and handle are cached pixmaps. The track color is interpolated by
+        # cross-fading the off and on tracks with the handle's progress, and the
+        # handle is drawn at a fractional position so motion stays smooth.
+        dpr = self.devicePixelRatioF()
+        enabled = self.isEnabled()
+        off_pos, on_pos = self._handle_range()
+        progress = min(max((self._circle_position - off_pos) / (on_pos - off_pos), 0.0), 1.0)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        if progress < 1:
+            painter.drawPixmap(0, 0, glyph_pixmap("switch_track_off", self.size(), dpr, enabled, self._render_track_off))
+        if progress > 0:
+            painter.setOpacity(progress)
+            painter.drawPixmap(0, 0, glyph_pixmap("switch_track_on", self.size(), dpr, enabled, self._render_track_on))
+            painter.setOpacity(1.0)
+
+        handle_diameter = self.height() - 4 # Handle radius is half the height minus 2
+        y_pos = (self.height() - handle_diameter) / 2
+        handle = glyph_pixmap("switch_handle", QSize(handle_diameter, handle_diameter), dpr, enabled, self._render_handle)
+        painter.drawPixmap(QPointF(self._circle_position, y_pos), handle)
+        painter.end()
+
+    def update_theme(self):
+        self.update()
+
+    def sizeHint(self):
+        return QSize(51, 31)
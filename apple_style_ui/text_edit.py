@@ -0,0 +1,331 @@
+"""Rich-text and streaming plain-text editors."""
+import codecs
+import os
+import queue
+import threading
+from PyQt6.QtWidgets import QTextEdit, QPlainTextEdit
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtCore import Qt, QElapsedTimer, pyqtSignal, QTimer, QThread
+
+from .fonts import font_factory
+from .styling import BORDER_RADIUS, apply_widget_stylesheet, register_application_style, theme_registry
+
+class AppleStyleTextEdit(QTextEdit):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFont(font_factory.font("body"))
+        self._apply_style()
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.DefaultContextMenu)
+        theme_registry.register(self)
+
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStyleTextEdit, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QTextEdit"):
+        return f"""
+            {selector} {{
+                background-color: {theme.hex.background_secondary};
+                color: {theme.hex.text_primary};
+                border: 1px solid {theme.hex.input_border};
+                border-radius: {BORDER_RADIUS};
+                padding: 8px 10px;
+            }}
+            {selector}:focus {{
+                border: 1.5px solid {theme.hex.input_border_focus};
+            }}
+            {selector}:disabled {{
+                background-color: {theme.hex.disabled_background};
+                color: {theme.hex.disabled_text};
+                border-color: {theme.hex.separator};
+            }}
+        """
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStyleTextEdit")
+
+    def update_theme(self):
+        self._apply_style()
+
+class _TextFileReader(QThread):
+    # Reads `path` from `offset` and queues decoded text that ends on a line boundary.
+    # The queue is bounded, so a slow GUI thread throttles the reader instead of buffering the file.
+    # chunkQueued wakes the GUI thread, which otherwise does not poll while the reader waits on I/O.
+    chunkQueued = pyqtSignal()
+
+    def __init__(self, path, encoding, offset, chunk_size, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.encoding = encoding
+        self.offset = offset
+        self.chunk_size = chunk_size
+        self.chunks = queue.Queue(maxsize=16)
+        self.bytes_read = 0
+        self.error = None
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def stop(self):
+        self.cancel()
+        self.wait()
+
+    def _put(self, text):
+        while not self._cancelled.is_set():
+            try:
+                self.chunks.put(text, timeout=0.1)
+                self.chunkQueued.emit()
+                return
+            except queue.Full:
+                pass
+
+    def run(self):
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        pending = ""
+        try:
+            with open(self.path, "rb") as file:
+                file.seek(self.offset)
+                while not self._cancelled.is_set():
+                    data = file.read(self.chunk_size)
+                    self.bytes_read += len(data)
+                    text = pending + decoder.decode(data, final=not data)
+                    if not data:
+                        if text:
+                            self._put(text)
+                        break
+                    cut = text.rfind("\n") + 1
+                    pending = text[cut:]
+                    if cut:
+                        self._put(text[:cut])
+        except (OSError, LookupError) as error:
+            self.error = error
+
+def _tail_offset(path, lines, block_size=65536):
+    # Byte offset of the last `lines` lines; assumes an ASCII-compatible encoding
+    with open(path, "rb") as file:
+        position = file.seek(0, os.SEEK_END)
+        if position:
+            file.seek(position - 1)
+            if file.read(1) == b"\n":
+                position -= 1 # A trailing newline does not start another line
+        newlines = 0
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            file.seek(position)
+            block = file.read(size)
+            cut = len(block)
+            while True:
+                cut = block.rfind(b"\n", 0, cut)
+                if cut < 0:
+                    break
+                newlines += 1
+                if newlines == lines:
+                    return position + cut + 1
+        return 0
+
+def _split_lines(text, lines):
+    # (first `lines` lines of text, the rest)
+    if text.count("\n") <= lines:
+        return text, ""
+    cut = -1
+    for _ in range(lines):
+        cut = text.find("\n", cut + 1)
+        if cut < 0:
+            return text, ""
+    return text[:cut + 1], text[cut + 1:]
+
+class AppleStylePlainTextEdit(QPlainTextEdit):
+    """
+    Read-only plain-text view for large files. loadFile() reads on a
+    background thread and appends in time-boxed batches, one per event-loop
+    turn, so the window stays responsive. `maximum_blocks` caps the lines kept
+    (older lines are dropped); `tail` starts near the end of the file and keeps
+    the view scrolled to the bottom.
+    """
+    loadProgress = pyqtSignal(int) # Percent of the bytes to read
+    loadFinished = pyqtSignal(bool) # False on error or cancel; see errorString()
+
+    CHUNK_SIZE = 64 * 1024
+    BATCH_BUDGET_MS = 10 # GUI time spent appending per event-loop turn
+    CAPPED_INSERT_LINES = 2048 # Lines per insert when a capped view is rebuilt
+
+    def __init__(self, parent=None, maximum_blocks=0, tail=False):
+        super().__init__(parent)
+        self.setFont(font_factory.font("body"))
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False) # An undo stack would keep a second copy of the file
+        self.setMaximumBlockCount(maximum_blocks)
+        self._tail = tail
+        self._reader = None
+        self._pending = [] # Chunks taken from the reader but not inserted yet
+        self._pending_lines = 0
+        self._total_bytes = 0
+        self._progress = -1
+        self._error = ""
+        self._append_timer = QTimer(self)
+        self._append_timer.setSingleShot(True)
+        self._append_timer.timeout.connect(self._append_batch)
+        self._apply_style()
+        theme_registry.register(self)
+
+    def setTailMode(self, tail):
+        self._tail = tail
+
+    def tailMode(self):
+        return self._tail
+
+    def isLoading(self):
+        return self._reader is not None
+
+    def errorString(self):
+        return self._error
+
+    def loadFile(self, path, encoding="utf-8"):
+        self.cancelLoad()
+        self.clear()
+        self._error = ""
+        self._progress = -1
+        self._lines_started = False
+        self._pending = []
+        self._pending_lines = 0
+        offset = 0
+        try:
+            size = os.path.getsize(path)
+            if self._tail and self.maximumBlockCount() > 0:
+                offset = _tail_offset(path, self.maximumBlockCount())
+        except OSError as error:
+            self._error = str(error)
+            self.loadFinished.emit(False)
+            return
+        self._total_bytes = size - offset
+        self._reader = _TextFileReader(path, encoding, offset, self.CHUNK_SIZE, self)
+        self._reader.chunkQueued.connect(self._schedule_append)
+        self._reader.finished.connect(self._schedule_append)
+        # Embedded widgets get no closeEvent; the thread must not outlive the widget
+        self.destroyed.connect(self._reader.stop)
+        self._reader.start()
+
+    def cancelLoad(self):
+        if self._reader is None:
+            return
+        self._append_timer.stop()
+        reader, self._reader = self._reader, None
+        reader.stop()
+        reader.deleteLater()
+        self._pending = []
+        self._pending_lines = 0
+        self._error = "Cancelled"
+        self.loadFinished.emit(False)
+
+    def _schedule_append(self):
+        # Appends run on a later event-loop turn, batching whatever has been queued by then
+        if self._reader is not None and not self._append_timer.isActive():
+            self._append_timer.start(0)
+
+    def _append_batch(self):
+        reader = self._reader
+        if reader is None:
+            return
+        elapsed = QElapsedTimer()
+        elapsed.start()
+        maximum = self.maximumBlockCount()
+        # Taking decoded chunks is cheap. What is held here stays bounded (a queue's worth, or up
+        # to `maximum` lines in a full capped view), so the bounded queue still throttles the reader.
+        while len(self._pending) < reader.chunks.maxsize or self._pending_lines < maximum:
+            try:
+                text = reader.chunks.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.append(text)
+            self._pending_lines += text.count("\n")
+        reader_done = reader.isFinished() and reader.chunks.empty()
+
+        room = None # Lines that fit without the block limit dropping any; None when unlimited
+        if maximum > 0:
+            room = maximum - self.blockCount() if self._lines_started else maximum
+            if room <= 0 and self._pending and (self._pending_lines >= maximum or reader_done):
+                # Dropping lines from the top of a full view costs far more than inserting into an
+                # empty one, so the view is rebuilt from its last lines and the held chunks instead
+                self._replace_with_tail(maximum)
+                room = maximum
+
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock() # One layout update per batch instead of per chunk
+        try:
+            while self._pending and elapsed.elapsed() < self.BATCH_BUDGET_MS and (room is None or room > 0):
+                text = self._pending.pop(0)
+                if room is not None:
+                    text, rest = _split_lines(text, room)
+                    if rest:
+                        self._pending.insert(0, rest)
+                    room -= text.count("\n")
+                self._pending_lines -= text.count("\n")
+                if text.endswith("\n"):
+                    text = text[:-1] # Block separators are inserted before, not after, each line
+                if self._lines_started:
+                    text = "\n" + text
+                self._lines_started = True
+                cursor.insertText(text.replace("\r", ""))
+        finally:
+            cursor.endEditBlock()
+        if self._tail:
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+        progress = 100 * reader.bytes_read // self._total_bytes if self._total_bytes else 100
+        if progress != self._progress:
+            self._progress = progress
+            self.loadProgress.emit(progress)
+        if (self._pending and (room is None or room > 0 or reader_done)) or not reader.chunks.empty():
+            self._append_timer.start(0) # The budget ran out; continue on the next turn
+        elif not self._pending and reader_done:
+            self._reader = None
+            reader.deleteLater()
+            if reader.error is not None:
+                self._error = str(reader.error)
+            self.loadFinished.emit(reader.error is None)
+        # Otherwise a full view holds chunks until more arrive; chunkQueued and finished reschedule
+
+    def _replace_with_tail(self, maximum):
+        # Clears the view and queues its last lines plus the held chunks, at most `maximum` lines
+        kept = maximum - self._pending_lines
+        parts = []
+        if kept > 0:
+            cursor = QTextCursor(self.document().findBlockByNumber(max(self.blockCount() - kept, 0)))
+            cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+            parts.append(cursor.selection().toPlainText() + "\n")
+        lines = "".join(parts + self._pending).split("\n")
+        ending = lines.pop() # "" when the text ends on a line boundary, else an unterminated last line
+        lines = lines[-maximum:] if not ending else lines[max(len(lines) + 1 - maximum, 0):] + [ending]
+        self.document().clear()
+        self._lines_started = False
+        step = self.CAPPED_INSERT_LINES
+        self._pending = ["\n".join(lines[i:i + step]) + "\n" for i in range(0, len(lines), step)]
+        if ending:
+            self._pending[-1] = self._pending[-1][:-1]
+        self._pending_lines = sum(text.count("\n") for text in self._pending)
+
+    def closeEvent(self, event):
+        self.cancelLoad()
+        super().closeEvent(event)
+
+    def _apply_style(self):
+        apply_widget_stylesheet(self, AppleStylePlainTextEdit, self._build_style)
+
+    @staticmethod
+    def _build_style(theme, selector="QPlainTextEdit"):
+        return AppleStyleTextEdit._build_style(theme, selector)
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        return cls._build_style(theme, "AppleStylePlainTextEdit")
+
+    def update_theme(self):
+        self._apply_style()
+
+register_application_style(AppleStyleTextEdit)
+register_application_style(AppleStylePlainTextEdit)
@@ -0,0 +1,161 @@
+"""
+Theme core: palettes, the theme registry and the active theme.
+
+Importing this module does not import Qt. Theme.hex is plain Python; the
+QColor, QBrush and QPen tables are built on first access, as are
+LIGHT_COLORS and DARK_COLORS (role -> QColor views of the registered themes).
+"""
+from types import MappingProxyType
+
+# --- Theme Management ---
+_LIGHT_HEX = {
+    "background": "#f8f8f8",
+    "background_secondary": "#ffffff",
+    "text_primary": "#1d1d1f",
+    "text_secondary": "#6e6e73",
+    "accent": "#007AFF",
+    "accent_hover": "#005ecb",
+    "accent_pressed": "#004a9e",
+    "separator": "#d2d2d7",
+    "disabled_background": "#e5e5e5",
+    "disabled_text": "#a0a0a0",
+    "input_border": "#c6c6c8",
+    "input_border_focus": "#007AFF", # Same as accent
+    "input_border_error": "#ff3b30",
+}
+
+_DARK_HEX = {
+    "background": "#1c1c1e",
+    "background_secondary": "#2c2c2e",
+    "text_primary": "#ffffff",
+    "text_secondary": "#8e8e93",
+    "accent": "#0A84FF",
+    "accent_hover": "#0060df",
+    "accent_pressed": "#004fad",
+    "separator": "#38383a",
+    "disabled_background": "#3a3a3c",
+    "disabled_text": "#636366",
+    "input_border": "#48484a",
+    "input_border_focus": "#0A84FF", # Same as accent
+    "input_border_error": "#ff453a",
+}
+
+_HEX_DIGITS = set("0123456789abcdef")
+
+def _hex_name(spec):
+    # Same result as QColor(spec).name() for "#rgb" and "#rrggbb"; anything else goes through QColor
+    if isinstance(spec, str) and spec.startswith("#") and set(spec[1:].lower()) <= _HEX_DIGITS:
+        digits = spec[1:].lower()
+        if len(digits) == 3:
+            return "#" + "".join(digit * 2 for digit in digits)
+        if len(digits) == 6:
+            return "#" + digits
+    from PyQt6.QtGui import QColor
+    return QColor(spec).name()
+
+class _RoleTable:
+    # Read-only role -> value table; a lookup is a plain attribute access.
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Theme tables are read-only")
+
+    def __getitem__(self, role):
+        return self.__dict__[role]
+
+class Theme:
+    """
+    Immutable palette. Hex strings, QColors, QBrushes and QPens are computed once
+    per role, e.g. theme.hex.accent, theme.color.accent, theme.brush.accent.
+    Roles missing from `colors` are inherited from `base`.
+    """
+    def __init__(self, name, colors, base=None):
+        specs = dict(base.specs) if base is not None else {}
+        specs.update(colors)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "base", base)
+        object.__setattr__(self, "specs", MappingProxyType(specs)) # Role -> color as given (hex string or QColor)
+        object.__setattr__(self, "hex", _RoleTable({role: _hex_name(spec) for role, spec in specs.items()}))
+
+    def __getattr__(self, name):
+        # Qt tables are built on first use, so palettes can be read without a QApplication or QtGui
+        from PyQt6.QtGui import QColor, QBrush, QPen
+        if name == "colors":
+            value = MappingProxyType({role: QColor(spec) for role, spec in self.specs.items()})
+        elif name == "color":
+            value = _RoleTable(self.colors)
+        elif name == "brush":
+            value = _RoleTable({role: QBrush(color) for role, color in self.colors.items()})
+        elif name == "pen":
+            value = _RoleTable({role: QPen(color) for role, color in self.colors.items()})
+        else:
+            raise AttributeError(name)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Theme objects are immutable")
+
+    def derive(self, colors, name=None):
+        # New theme overriding some roles of this one, e.g. a brand accent color
+        return Theme(name or self.name, colors, base=self)
+
+    def __repr__(self):
+        return f"Theme({self.name!r})"
+
+LIGHT_THEME = Theme("light", _LIGHT_HEX)
+DARK_THEME = Theme("dark", _DARK_HEX, base=LIGHT_THEME)
+
+_THEMES = {"light": LIGHT_THEME, "dark": DARK_THEME}
+_ACTIVE_THEME = LIGHT_THEME
+THEME = _ACTIVE_THEME.name # Name of the active theme, kept for backwards compatibility
+
+# Called after register_theme(); the styling module hooks its caches in here
+_THEME_REGISTERED_CALLBACKS = []
+
+def register_theme(theme):
+    # Adds a palette (e.g. high-contrast or brand) or replaces one with the same name
+    global _ACTIVE_THEME
+    _THEMES[theme.name] = theme
+    if _ACTIVE_THEME.name == theme.name:
+        _ACTIVE_THEME = theme
+    for callback in _THEME_REGISTERED_CALLBACKS:
+        callback()
+
+def get_theme(name):
+    return _THEMES[name]
+
+def available_themes():
+    return list(_THEMES)
+
+def active_theme():
+    return _ACTIVE_THEME
+
+def activate_theme(name):
+    # Swaps the active palette in one assignment; unknown names fall back to light
+    global _ACTIVE_THEME, THEME
+    _ACTIVE_THEME = _THEMES.get(name, LIGHT_THEME)
+    THEME = _ACTIVE_THEME.name
+    return _ACTIVE_THEME
+
+# Function to get color based on current theme and role
+def get_color(role):
+    color = _ACTIVE_THEME.colors.get(role)
+    if color is None:
+        from PyQt6.QtGui import QColor
+        color = QColor("magenta") # Fallback for unknown roles
+    return color
+
+# Function to change palette colors at runtime, e.g. update_palette("dark", {"accent": "#ff9500"})
+def update_palette(theme_name, colors):
+    register_theme(get_theme(theme_name).derive(colors))
+
+def __getattr__(name):
+    # LIGHT_COLORS / DARK_COLORS: read-only role -> QColor mappings of the current light and
+    # dark themes, resolved on access so that importing the theme core stays Qt-free
+    if name == "LIGHT_COLORS":
+        return get_theme("light").colors
+    if name == "DARK_COLORS":
+        return get_theme("dark").colors
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,742 @@
+"""Main window, sections, virtual and lazily built content, and the toast overlay."""
+import os
+import sys
+from PyQt6 import sip
+from PyQt6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QScrollArea, QLayout, QSizePolicy, QLineEdit, QTextEdit,
+    QPlainTextEdit, QComboBox, QDateEdit, QSlider, QFrame
+)
+from PyQt6.QtGui import QColor, QPainter, QPalette
+from PyQt6.QtCore import Qt, QElapsedTimer, QSize, QDate, QRectF, pyqtSignal, QTimer, QEvent
+
+from . import styling
+from .theme import active_theme, activate_theme
+from .fonts import font_factory
+from .styling import cached_stylesheet, apply_application_stylesheet, register_application_style, theme_registry
+from .rendering import render_cache
+from .async_support import asyncio_driver
+from .label import AppleStyleLabel, AppleStyleMessageLabel
+from .settings import SettingsStore
+
+class VirtualContentArea(QWidget):
+    """
+    Scroll content that keeps live widgets only for the rows in or near the
+    viewport of `scroll_area`. Rows come from a QAbstractItemModel and share one
+    height; `create_row(parent)` builds a row widget and `bind_row(widget, index)`
+    fills it from a model index. Widgets leaving the viewport are recycled, so
+    scrolling and resizing cost depends on the viewport, not the row count.
+    """
+    def __init__(self, scroll_area, model, create_row, bind_row, row_height=44, overscan=4, margin=25, spacing=18):
+        super().__init__()
+        self._scroll_area = scroll_area
+        self._model = model
+        self._create_row = create_row
+        self._bind_row = bind_row
+        self._row_height = row_height + spacing # Rows are laid out on a fixed pitch
+        self._widget_height = row_height
+        self._overscan = overscan
+        self._margin = margin
+        self._live_rows = {} # row -> widget
+        self._spare_widgets = []
+
+        scroll_area.verticalScrollBar().valueChanged.connect(self._update_rows)
+        # A taller viewport needs more rows even when this widget keeps its size
+        scroll_area.viewport().installEventFilter(self)
+        model.modelReset.connect(self._reset_rows)
+        model.layoutChanged.connect(self._reset_rows)
+        model.rowsInserted.connect(self._reset_rows)
+        model.rowsRemoved.connect(self._reset_rows)
+        model.rowsMoved.connect(self._reset_rows)
+        model.dataChanged.connect(self._rebind_rows)
+        self._update_content_height()
+
+    def model(self):
+        return self._model
+
+    def rowWidget(self, row):
+        # The live widget for `row`, or None while the row is outside the viewport
+        return self._live_rows.get(row)
+
+    def scrollToRow(self, row):
+        self._scroll_area.verticalScrollBar().setValue(self._margin + row * self._row_height)
+
+    def _update_content_height(self):
+        # Qt caps widget heights at 16,777,215 px, about 270k rows at the default pitch
+        rows = self._model.rowCount()
+        self.setMinimumHeight(2 * self._margin + max(rows * self._row_height - (self._row_height - self._widget_height), 0))
+
+    def _visible_rows(self):
+        rows = self._model.rowCount()
+        top = self._scroll_area.verticalScrollBar().value() - self._margin
+        bottom = top + self._scroll_area.viewport().height()
+        first = max(top // self._row_height - self._overscan, 0)
+        last = min(bottom // self._row_height + 1 + self._overscan, rows)
+        return first, last
+
+    def _update_rows(self):
+        first, last = self._visible_rows()
+        for row in [row for row in self._live_rows if not first <= row < last]:
+            widget = self._live_rows.pop(row)
+            widget.hide()
+            self._spare_widgets.append(widget)
+
+        width = self.width() - 2 * self._margin
+        for row in range(first, last):
+            widget = self._live_rows.get(row)
+            if widget is None:
+                widget = self._spare_widgets.pop() if self._spare_widgets else self._create_row(self)
+                self._bind_row(widget, self._model.index(row, 0))
+                self._live_rows[row] = widget
+            widget.setGeometry(self._margin, self._margin + row * self._row_height, width, self._widget_height)
+            widget.show()
+
+    def _reset_rows(self, *args):
+        for widget in self._live_rows.values():
+            widget.hide()
+            self._spare_widgets.append(widget)
+        self._live_rows.clear()
+        self._update_content_height()
+        self._update_rows()
+
+    def _rebind_rows(self, top_left, bottom_right, roles=()):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            widget = self._live_rows.get(row)
+            if widget is not None:
+                self._bind_row(widget, self._model.index(row, 0))
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Resize and obj is self._scroll_area.viewport():
+            self._update_rows()
+        return super().eventFilter(obj, event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_rows()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_rows()
+
+class AppleStyleToast(QWidget):
+    """
+    Overlay notification drawn above the window content. It is positioned by
+    hand and paints its own text, so showing a message never touches the content
+    layout. Messages are queued: a repeat of the visible message extends it and
+    shows a count, queued duplicates are dropped, every message stays up for at
+    least MIN_DISPLAY_MS, and a burst keeps only the newest MAX_QUEUED messages.
+    One timer drives the whole queue.
+    """
+    MIN_DISPLAY_MS = 600
+    MAX_QUEUED = 3
+    BOTTOM_MARGIN = 24
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setFont(font_factory.font("label", 13))
+        self._text = ""
+        self._elided_text = ""
+        self._count = 0
+        self._shown_ms = 0
+        self._deadline_ms = 0
+        self._queue = [] # [text, duration_ms]
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._advance)
+        self.hide()
+        theme_registry.register(self)
+
+    def text(self):
+        return self._display_text() if self.isVisible() else ""
+
+    def enqueue(self, text, duration_ms=3000):
+        now = self._clock.elapsed()
+        if self.isVisible() and text == self._text and not self._queue:
+            self._count += 1
+            self._deadline_ms = now + duration_ms
+            self._relayout()
+        elif self.isVisible():
+            for queued in self._queue:
+                if queued[0] == text:
+                    queued[1] = duration_ms
+                    break
+            else:
+                self._queue.append([text, duration_ms])
+                del self._queue[:-self.MAX_QUEUED]
+        else:
+            self._show(text, duration_ms)
+        self._schedule()
+
+    def clear(self):
+        self._queue.clear()
+        self._timer.stop()
+        self.hide()
+
+    def _show(self, text, duration_ms):
+        now = self._clock.elapsed()
+        self._text = text
+        self._count = 1
+        self._shown_ms = now
+        self._deadline_ms = now + duration_ms
+        self._relayout()
+        self.show()
+        self.raise_()
+
+    def _schedule(self):
+        now = self._clock.elapsed()
+        if self._queue:
+            due = self._shown_ms + self.MIN_DISPLAY_MS
+        else:
+            due = self._deadline_ms
+        self._timer.start(max(0, due - now))
+
+    def _advance(self):
+        if self._queue:
+            self._show(*self._queue.pop(0))
+            self._schedule()
+        elif self._clock.elapsed() >= self._deadline_ms:
+            self.hide()
+        else:
+            self._schedule()
+
+    def _display_text(self):
+        return f"{self._text} (×{self._count})" if self._count > 1 else self._text
+
+    def _relayout(self):
+        parent = self.parentWidget()
+        metrics = self.fontMetrics()
+        available = parent.width() - 40
+        text = metrics.elidedText(self._display_text(), Qt.TextElideMode.ElideRight, max(available - 32, 0))
+        width = min(metrics.horizontalAdvance(text) + 32, available)
+        height = metrics.height() + 16
+        self._elided_text = text
+        self.setGeometry((parent.width() - width) // 2, parent.height() - height - self.BOTTOM_MARGIN, width, height)
+        self.update()
+
+    def paintEvent(self, event):
+        theme = active_theme()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        background = QColor(theme.color.text_primary)
+        background.setAlphaF(0.88)
+        painter.setBrush(background)
+        radius = self.height() / 2
+        painter.drawRoundedRect(QRectF(self.rect()), radius, radius)
+        painter.setPen(theme.pen.background)
+        painter.drawText(self.rect(), int(Qt.AlignmentFlag.AlignCenter), self._elided_text)
+
+    def update_theme(self):
+        self.update()
+
+class LazyContentSlot(QWidget):
+    """
+    Placeholder that reserves `size_hint` in the content layout and builds its
+    widget from `factory()` on first materialize(). AppleStyleWindow calls that
+    when the slot nears the viewport or while the application is idle.
+    """
+    materialized = pyqtSignal(QWidget)
+
+    def __init__(self, factory, size_hint, parent=None):
+        super().__init__(parent)
+        self.setObjectName("appleStyleLazySlot")
+        self._factory = factory
+        self._widget = None
+        self._size_hint = size_hint if isinstance(size_hint, QSize) else QSize(0, int(size_hint))
+        self._slot_layout = QVBoxLayout(self)
+        self._slot_layout.setContentsMargins(0, 0, 0, 0)
+        self.setMinimumHeight(self._size_hint.height())
+
+    def widget(self):
+        return self._widget
+
+    def isMaterialized(self):
+        return self._widget is not None
+
+    def sizeHint(self):
+        if self._widget is None:
+            return self._size_hint
+        return super().sizeHint()
+
+    def materialize(self):
+        if self._widget is None:
+            self._widget = self._factory()
+            self._factory = None
+            _prepare_content_widget(self._widget)
+            self.setMinimumHeight(0)
+            self._slot_layout.addWidget(self._widget)
+            self.materialized.emit(self._widget)
+        return self._widget
+
+def _prepare_content_widget(widget):
+    if styling.STYLE_MODE == "widget" and not hasattr(widget, 'update_theme') and widget.layout() is not None:
+        # Plain containers should not paint the content background over their children
+        widget.setStyleSheet("QWidget { background-color: transparent; }")
+
+class _SectionHeader(AppleStyleLabel):
+    clicked = pyqtSignal()
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if event.button() == Qt.MouseButton.LeftButton and self.rect().contains(event.position().toPoint()):
+            self.clicked.emit()
+
+class AppleStyleSection(QWidget):
+    """
+    A titled group of content rows with its own layout, so inserting or
+    removing a row only relayouts this section. A collapsed section hides its
+    body, which then takes no part in layout. Hide the whole section with
+    setVisible(False).
+    """
+    collapsedChanged = pyqtSignal(bool)
+
+    def __init__(self, title="", parent=None, collapsible=True, collapsed=False, spacing=18):
+        super().__init__(parent)
+        self._title = title
+        self._collapsible = collapsible
+        self._collapsed = False
+        # Always exactly as tall as its rows: the content layout never squeezes or stretches
+        # a section, so growing one section does not re-geometry the rows of the others
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        section_layout = QVBoxLayout(self)
+        section_layout.setContentsMargins(0, 0, 0, 0)
+        section_layout.setSpacing(spacing)
+
+        self.header = _SectionHeader("", self, font_size=16)
+        if collapsible:
+            self.header.setCursor(Qt.CursorShape.PointingHandCursor)
+            self.header.clicked.connect(self.toggle)
+        self.header.setVisible(bool(title) or collapsible)
+        section_layout.addWidget(self.header)
+
+        self.body = QWidget(self)
+        self._body_layout = QVBoxLayout(self.body)
+        self._body_layout.setContentsMargins(0, 0, 0, 0)
+        self._body_layout.setSpacing(spacing)
+        section_layout.addWidget(self.body)
+
+        self.setCollapsed(collapsed)
+        self._update_header()
+
+    def title(self):
+        return self._title
+
+    def setTitle(self, title):
+        self._title = title
+        self._update_header()
+
+    def _update_header(self):
+        arrow = ("▸ " if self._collapsed else "▾ ") if self._collapsible else ""
+        self.header.setText(arrow + self._title)
+
+    def isCollapsed(self):
+        return self._collapsed
+
+    def setCollapsed(self, collapsed):
+        if collapsed == self._collapsed or (collapsed and not self._collapsible):
+            return
+        self._collapsed = collapsed
+        self.body.setVisible(not collapsed)
+        self._update_header()
+        self.collapsedChanged.emit(collapsed)
+
+    def toggle(self):
+        self.setCollapsed(not self._collapsed)
+
+    def count(self):
+        return self._body_layout.count()
+
+    def widget(self, index):
+        item = self._body_layout.itemAt(index)
+        return item.widget() if item is not None else None
+
+    def indexOf(self, widget):
+        return self._body_layout.indexOf(widget)
+
+    def addWidget(self, widget):
+        return self.insertWidget(-1, widget)
+
+    def insertWidget(self, index, widget):
+        # A negative index appends
+        _prepare_content_widget(widget)
+        self._body_layout.insertWidget(index, widget)
+        return widget
+
+    def removeWidget(self, widget):
+        # Removes `widget` from the section and deletes it
+        self._body_layout.removeWidget(widget)
+        widget.hide()
+        widget.deleteLater()
+
+    def clear(self):
+        self.body.setUpdatesEnabled(False)
+        try:
+            while self._body_layout.count():
+                widget = self._body_layout.takeAt(self._body_layout.count() - 1).widget()
+                if widget is not None:
+                    widget.hide()
+                    widget.deleteLater()
+        finally:
+            self.body.setUpdatesEnabled(True)
+
+class AppleStyleWindow(QMainWindow):
+    LAZY_LOOKAHEAD_VIEWPORTS = 1 # Slots within this many viewport heights below the view are built
+    LAZY_IDLE_BUDGET_MS = 4 # Per idle tick; 0 builds slots only when they near the viewport
+
+    def __init__(self, title="Apple Style App"):
+        super().__init__()
+        self.setWindowTitle(title)
+        desktop = QApplication.primaryScreen().geometry()
+        width = 700 # Increased width to accommodate more elements
+        height = 750 # Increased height
+        
+        self._load_settings() # Load theme before setting up UI that depends on it
+        self.setGeometry( (desktop.width() - width) // 2, (desktop.height() - height) // 2, width, height)
+        geometry = self.settings_store.value("geometry")
+        if geometry:
+            self.restoreGeometry(geometry)
+        # self.current_theme is set by _load_settings or defaults to THEME
+
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setFrameShape(QFrame.Shape.NoFrame)
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+
+        self.scroll_content_widget = QWidget()
+        self.scroll_content_widget.setObjectName("appleStyleContent")
+        self.layout = QVBoxLayout(self.scroll_content_widget)
+        self.layout.setContentsMargins(25, 25, 25, 25)
+        self.layout.setSpacing(18)
+        # The content grows with the layout in the same pass; otherwise the scroll area resizes it
+        # one event later and every row is first squeezed into the old height, then moved back
+        self.layout.setSizeConstraint(QLayout.SizeConstraint.SetMinimumSize)
+        
+        self.message_label = AppleStyleMessageLabel(self.scroll_content_widget) # Kept for compatibility; show_message uses the toast
+
+        self._async_tasks = set()
+        self._sections = {}
+        self._stretch_item = None # The trailing stretch, if any; content is inserted before it
+
+        # Lazily built content (see addContentWidget)
+        self._lazy_slots = []
+        self._lazy_check_timer = QTimer(self)
+        self._lazy_check_timer.setSingleShot(True) # Coalesces scroll/resize/layout events into one check
+        self._lazy_check_timer.timeout.connect(self._materialize_near_viewport)
+        self._lazy_idle_timer = QTimer(self)
+        self._lazy_idle_timer.timeout.connect(self._materialize_idle)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._schedule_lazy_check)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._scroll_position_changed)
+        self._scroll_restored = False
+        self._tracks_screen = False
+        self.scroll_area.viewport().installEventFilter(self)
+        self.scroll_content_widget.installEventFilter(self)
+
+        self.scroll_area.setWidget(self.scroll_content_widget)
+        self.setCentralWidget(self.scroll_area)
+        self.toast = AppleStyleToast(self) # Overlay, outside the content layout
+        self._apply_theme_styles() # Apply theme after all base UI structure is set
+        theme_registry.register(self)
+
+        # APPLE_STYLE_UI_INSTRUMENT=1 turns on the hot-path counters, "hud" also shows them
+        instrument = os.environ.get("APPLE_STYLE_UI_INSTRUMENT")
+        if instrument:
+            from .profiling import instrumentation, InstrumentationHUD
+            instrumentation.enable()
+            if instrument == "hud":
+                self.instrumentation_hud = InstrumentationHUD(self)
+
+    def _apply_theme_styles(self):
+        if styling.STYLE_MODE == "application":
+            apply_application_stylesheet()
+        else:
+            # The window, scroll area and content are ancestors of every content widget, and a
+            # stylesheet change re-polishes the whole subtree below it. Their backgrounds come from
+            # the palette instead, and only the scroll bar, which holds no content, gets a stylesheet.
+            background = active_theme().color.background
+            for widget in ((self, self.scroll_area) if sys.platform != "darwin" else (self.scroll_area,)):
+                if widget.palette().color(QPalette.ColorRole.Window) != background:
+                    palette = QPalette(widget.palette())
+                    palette.setColor(QPalette.ColorRole.Window, background)
+                    widget.setPalette(palette)
+            self.scroll_content_widget.setAutoFillBackground(True)
+            self.scroll_area.verticalScrollBar().setStyleSheet(cached_stylesheet(QScrollArea, self._build_scroll_area_style))
+
+    @staticmethod
+    def _build_window_style(theme, selector="QMainWindow"):
+        return f"{selector} {{ background-color: {theme.hex.background}; }}"
+
+    @staticmethod
+    def _build_scroll_area_style(theme, scope=""):
+        return f"""
+            {scope}QScrollArea {{
+                background-color: {theme.hex.background};
+                border: none;
+            }}
+            {scope}QScrollBar:vertical {{
+                border: none;
+                background: {theme.hex.separator};
+                width: 10px;
+                margin: 0px 0px 0px 0px;
+            }}
+            {scope}QScrollBar::handle:vertical {{
+                background: {theme.hex.text_secondary};
+                min-height: 20px;
+                border-radius: 5px;
+            }}
+        """
+
+    @staticmethod
+    def _build_content_style(theme, selector="QWidget"):
+        return f"{selector} {{ background-color: {theme.hex.background}; }}"
+
+    @classmethod
+    def _build_application_style(cls, theme):
+        stylesheet = cls._build_scroll_area_style(theme, "AppleStyleWindow ") + cls._build_content_style(theme, "QWidget#appleStyleContent")
+        if sys.platform != "darwin":
+            stylesheet = cls._build_window_style(theme, "AppleStyleWindow") + stylesheet
+        return stylesheet
+
+    def _load_settings(self):
+        # One QSettings for the window's lifetime; writes go through the store's background thread
+        self.settings_store = SettingsStore("MyCompany", "AppleStyleApp", self)
+        self.settings = self.settings_store.settings
+        
+        theme_setting = self.settings_store.value("theme", "light", type=str)
+        self.current_theme = activate_theme(theme_setting).name
+
+    def _save_settings(self):
+        self.settings_store.setValue("theme", self.current_theme) # Written after DEBOUNCE_MS, off the GUI thread
+
+    def persistWidget(self, key, widget):
+        """
+        Restores `widget`'s value from the settings and keeps it saved under
+        "form/<key>". Supports line and text edits, checkable buttons, sliders,
+        combo boxes and date edits.
+        """
+        key = f"form/{key}"
+        if isinstance(widget, QLineEdit):
+            getter, setter, changed = widget.text, widget.setText, widget.textChanged
+        elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
+            getter, setter, changed = widget.toPlainText, widget.setPlainText, widget.textChanged
+        elif isinstance(widget, QDateEdit):
+            getter = lambda: widget.date().toString(Qt.DateFormat.ISODate)
+            setter = lambda value: widget.setDate(QDate.fromString(value, Qt.DateFormat.ISODate))
+            changed = widget.dateChanged
+        elif isinstance(widget, QComboBox):
+            getter, changed = widget.currentIndex, widget.currentIndexChanged
+            setter = lambda value: widget.setCurrentIndex(int(value))
+        elif isinstance(widget, QSlider):
+            getter, changed = widget.value, widget.valueChanged
+            setter = lambda value: widget.setValue(int(value))
+        elif hasattr(widget, "isChecked"):
+            getter, changed = widget.isChecked, widget.toggled
+            setter = lambda value: widget.setChecked(value in (True, "true", 1, "1"))
+        else:
+            raise TypeError(f"Cannot persist {type(widget).__name__}")
+        if self.settings_store.contains(key):
+            setter(self.settings_store.value(key))
+        changed.connect(lambda *_: self.settings_store.markDirty(key, getter)) # Read once per flush
+
+    def _scroll_position_changed(self, value):
+        if self._scroll_restored:
+            self.settings_store.setValue("scroll_position", value)
+
+    def _restore_scroll_position(self):
+        self._scroll_restored = True
+        self.scroll_area.verticalScrollBar().setValue(self.settings_store.value("scroll_position", 0, type=int))
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self.settings_store.markDirty("geometry", self.saveGeometry)
+
+    def set_theme(self, theme_name):
+        self.current_theme = activate_theme(theme_name).name # Update instance variable
+        self._save_settings()
+        theme_registry.apply_theme() # Restyles every registered widget, this window included
+
+    def update_theme(self):
+        self._apply_theme_styles()
+
+    def addContentWidget(self, widget, size_hint=None):
+        # `widget` may also be a factory; with a size_hint (QSize or height) it is built lazily
+        if size_hint is not None and not isinstance(widget, QWidget):
+            widget = self._add_lazy_slot(widget, size_hint)
+        else:
+            _prepare_content_widget(widget)
+        if self._stretch_item is not None:
+            self.layout.insertWidget(self._stretch_index(), widget) # Keep the content above the stretch
+        else:
+            self.layout.addWidget(widget)
+        return widget
+
+    def addSection(self, name, title=None, collapsible=True, collapsed=False):
+        """
+        Adds a named AppleStyleSection to the content; rows are then added
+        with section(name).addWidget(). `title` defaults to `name`.
+        """
+        if name in self._sections:
+            raise ValueError(f"Duplicate section name: {name}")
+        section = AppleStyleSection(name if title is None else title, collapsible=collapsible,
+                                    collapsed=collapsed, spacing=self.layout.spacing())
+        section.setObjectName(name)
+        self._sections[name] = section
+        return self.addContentWidget(section)
+
+    def section(self, name):
+        return self._sections[name]
+
+    def sections(self):
+        return list(self._sections.values())
+
+    def removeSection(self, name):
+        section = self._sections.pop(name)
+        self.layout.removeWidget(section)
+        section.hide()
+        section.deleteLater()
+
+    def _add_lazy_slot(self, factory, size_hint):
+        slot = LazyContentSlot(factory, size_hint)
+        if not self._lazy_slots:
+            self._lazy_check_timer.start()
+        self._lazy_slots.append(slot)
+        return slot
+
+    def materializeAll(self):
+        for slot in self._lazy_slots:
+            slot.materialize()
+        self._lazy_slots.clear()
+
+    def _schedule_lazy_check(self):
+        if self._lazy_slots:
+            self._lazy_check_timer.start()
+
+    def _materialize_near_viewport(self):
+        # Before the window is shown every slot is still at y=0; showEvent schedules the check again
+        if not self.isVisible():
+            return
+        # Slots are kept in layout order, so the scan stops at the first one below the look-ahead area
+        viewport = self.scroll_area.viewport()
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + viewport.height() * (1 + self.LAZY_LOOKAHEAD_VIEWPORTS)
+        remaining = []
+        for index, slot in enumerate(self._lazy_slots):
+            if slot.isMaterialized():
+                continue
+            slot_top = slot.y()
+            if slot_top > bottom:
+                remaining.extend(self._lazy_slots[index:])
+                break
+            if slot_top + slot.height() >= top:
+                slot.materialize()
+            else:
+                remaining.append(slot)
+        self._lazy_slots = remaining
+        if self._lazy_slots and self.LAZY_IDLE_BUDGET_MS > 0 and self.isVisible():
+            self._lazy_idle_timer.start()
+
+    def _materialize_idle(self):
+        # Builds pending slots in small time slices while the event loop has nothing else to do
+        elapsed = QElapsedTimer()
+        elapsed.start()
+        while self._lazy_slots and elapsed.elapsed() < self.LAZY_IDLE_BUDGET_MS:
+            self._lazy_slots.pop(0).materialize()
+        if not self._lazy_slots:
+            self._lazy_idle_timer.stop()
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.Resize, QEvent.Type.LayoutRequest):
+            self._schedule_lazy_check()
+        return super().eventFilter(obj, event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_lazy_check()
+        if not self._scroll_restored:
+            QTimer.singleShot(0, self._restore_scroll_position) # After the content has its size
+        if not self._tracks_screen and self.windowHandle() is not None:
+            self._tracks_screen = True
+            self.windowHandle().screenChanged.connect(self._screen_changed)
+
+    def _screen_changed(self, screen):
+        # Widgets repaint at the new devicePixelRatio on their own; pixmaps for ratios
+        # no visible window uses any more are released
+        render_cache.retain_device_pixel_ratios()
+
+    def setVirtualContent(self, model, create_row, bind_row, row_height=44, overscan=4):
+        # Replaces the layout-based content with rows materialized on demand from `model`
+        self._layout_content_widget = self.scroll_area.takeWidget() # Kept alive, not deleted
+        self.scroll_content_widget = VirtualContentArea(
+            self.scroll_area, model, create_row, bind_row, row_height, overscan,
+            margin=self.layout.contentsMargins().top(), spacing=self.layout.spacing())
+        self.scroll_content_widget.setObjectName("appleStyleContent")
+        self.scroll_area.setWidget(self.scroll_content_widget)
+        self._apply_theme_styles()
+        return self.scroll_content_widget
+
+    def _stretch_index(self):
+        # The stretch is normally last; widgets added through self.layout directly may follow it
+        last = self.layout.count() - 1
+        if self.layout.itemAt(last) is self._stretch_item:
+            return last
+        return self.layout.indexOf(self._stretch_item)
+
+    def addStretch(self, stretch=1):
+        # Only one stretch: the previous one is replaced, wherever it now is
+        if self._stretch_item is not None:
+            self.layout.takeAt(self._stretch_index())
+        self.layout.addStretch(stretch)
+        self._stretch_item = self.layout.itemAt(self.layout.count() - 1)
+
+    def show_message(self, message, duration_ms=3000):
+        self.toast.enqueue(message, duration_ms)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.settings_store.markDirty("geometry", self.saveGeometry)
+        if self.toast.isVisible():
+            self.toast._relayout()
+
+    def run_async(self, coro):
+        # Schedules `coro` on asyncio_driver; it is cancelled when the window closes
+        task = asyncio_driver.create_task(coro)
+        self._async_tasks.add(task)
+        task.add_done_callback(self._async_tasks.discard)
+        return task
+
+    def connect_async(self, button, coroutine_function, progress_bar=None):
+        """
+        Runs `coroutine_function()` as a task on every click of `button`. The
+        button is disabled while the task runs, and `progress_bar`, if given,
+        shows a busy indicator. Errors are reported with show_message().
+        """
+        def finish(task):
+            if sip.isdeleted(button):
+                return
+            button.setEnabled(True)
+            if progress_bar is not None and not sip.isdeleted(progress_bar):
+                progress_bar.setRange(*saved_range)
+                progress_bar.setValue(saved_range[0])
+            if not task.cancelled() and task.exception() is not None:
+                self.show_message(f"Error: {task.exception()}")
+
+        def start(*_):
+            nonlocal saved_range
+            button.setEnabled(False)
+            if progress_bar is not None:
+                saved_range = (progress_bar.minimum(), progress_bar.maximum())
+                progress_bar.setRange(0, 0) # Busy indicator
+            self.run_async(coroutine_function()).add_done_callback(finish)
+
+        saved_range = None
+        button.clicked.connect(start)
+
+    def closeEvent(self, event):
+        self._save_settings() # Save settings on close
+        self.settings_store.flush(wait=True)
+        asyncio_driver.cancel(self._async_tasks)
+        super().closeEvent(event)
+
+register_application_style(AppleStyleWindow)
@@ -0,0 +1,85 @@
+"""
+Per-frame cost of the AnimatedButton hover animation.
+
+Compares the previous behaviour (a full stylesheet rebuild and setStyleSheet on
+every animation frame) with the current one (the colour is painted in
+paintEvent, so a frame is a property write plus a repaint).
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen PYTHONPATH=. python benchmarks/bench_button_animation.py
+"""
+import sys
+import time
+
+from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout, QPushButton
+from PyQt6.QtGui import QColor
+
+from apple_style_ui import AppleStyleButton, BORDER_RADIUS
+
+
+class LegacyStyleSheetButton(AppleStyleButton):
+    # Reproduces the old per-frame path: every colour change re-parses a stylesheet.
+    def _apply_style(self):
+        bg_color = self._current_bg_color if self.isEnabled() else self._disabled_bg_color
+        self.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {bg_color.name()};
+                color: {self._text_color.name()};
+                border: none;
+                padding: 10px 20px;
+                border-radius: {BORDER_RADIUS};
+                font-size: 14px;
+                font-weight: 500;
+            }}
+        """)
+
+    def paintEvent(self, event):
+        QPushButton.paintEvent(self, event) # The stylesheet draws the background
+
+    def _set_frame_color(self, color):
+        self._current_bg_color = color
+        self._apply_style()
+
+
+def _interpolate(start, end, t):
+    return QColor(
+        int(start.red() + (end.red() - start.red()) * t),
+        int(start.green() + (end.green() - start.green()) * t),
+        int(start.blue() + (end.blue() - start.blue()) * t),
+    )
+
+
+def run(button_class, buttons=40, frames=10):
+    """Sweep `frames` animation frames across a toolbar of `buttons` buttons; returns seconds per frame."""
+    container = QWidget()
+    layout = QHBoxLayout(container)
+    toolbar = [button_class(f"Button {i}") for i in range(buttons)]
+    for button in toolbar:
+        layout.addWidget(button)
+    container.show()
+    QApplication.processEvents()
+
+    start_color, end_color = toolbar[0]._default_bg_color, toolbar[0]._hover_bg_color
+    colors = [_interpolate(start_color, end_color, i / frames) for i in range(1, frames + 1)]
+
+    started = time.perf_counter()
+    for button in toolbar:
+        for color in colors:
+            if isinstance(button, LegacyStyleSheetButton):
+                button._set_frame_color(color)
+            else:
+                button.backgroundColor = color
+            button.repaint() # Paint synchronously so the frame cost is fully accounted for
+    elapsed = time.perf_counter() - started
+
+    container.close()
+    return elapsed / (buttons * frames)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    legacy = run(LegacyStyleSheetButton)
+    current = run(AppleStyleButton)
+    print(f"setStyleSheet per frame : {legacy * 1e6:8.1f} us/frame")
+    print(f"paintEvent per frame    : {current * 1e6:8.1f} us/frame")
+    print(f"speed-up                : {legacy / current:8.1f}x")
@@ -0,0 +1,102 @@
+"""
+Declarative form building versus hand-written construction.
+
+Builds the same 1,000-field form twice: once with one addContentWidget call per
+label and widget, as the sample app does, and once with build_form. Each run is
+timed from the first widget to the first painted frame (construction, polish
+and layout included), in a fresh window.
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen PYTHONPATH=. python benchmarks/bench_form_builder.py
+"""
+import statistics
+import sys
+import tempfile
+import time
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QSettings, QEvent
+
+from apple_style_ui import (
+    AppleStyleWindow, AppleStyleLabel, AppleStyleLineEdit, AppleStyleCheckBox, AppleStyleSwitch,
+    AppleStyleSlider, AppleStyleComboBox, AppleStyleDateEdit, AppleStyleProgressBar, build_form,
+)
+
+OPTIONS = ["Student", "Developer", "Designer", "Other"]
+
+# One entry per field kind: (spec, hand-written factory)
+FIELD_KINDS = [
+    ({"type": "line_edit", "placeholder": "Name"}, lambda: _with(AppleStyleLineEdit(), "setPlaceholderText", "Name")),
+    ({"type": "check_box", "text": "Subscribe", "default": True}, lambda: _with(AppleStyleCheckBox("Subscribe"), "setChecked", True)),
+    ({"type": "switch"}, AppleStyleSwitch),
+    ({"type": "slider", "default": 50}, lambda: _with(AppleStyleSlider(Qt.Orientation.Horizontal), "setValue", 50)),
+    ({"type": "combo_box", "options": OPTIONS}, lambda: _with(AppleStyleComboBox(), "addItems", OPTIONS)),
+    ({"type": "date_edit"}, AppleStyleDateEdit),
+    ({"type": "progress_bar", "default": 30}, lambda: _with(AppleStyleProgressBar(), "setValue", 30)),
+]
+
+
+def _with(widget, method, value):
+    getattr(widget, method)(value)
+    return widget
+
+
+def form_spec(fields):
+    section_size = 50
+    sections = []
+    for start in range(0, fields, section_size):
+        section = {"title": f"Section {start // section_size + 1}", "fields": []}
+        for i in range(start, min(start + section_size, fields)):
+            spec, _ = FIELD_KINDS[i % len(FIELD_KINDS)]
+            field = dict(spec, name=f"field{i}", tooltip=f"Field {i}")
+            if spec["type"] != "check_box":
+                field["label"] = f"Field {i}"
+            section["fields"].append(field)
+        sections.append(section)
+    return {"sections": sections}
+
+
+def build_by_hand(window, fields):
+    section_size = 50
+    widgets = {}
+    for i in range(fields):
+        if i % section_size == 0:
+            window.addContentWidget(AppleStyleLabel(f"Section {i // section_size + 1}", font_size=16))
+        spec, factory = FIELD_KINDS[i % len(FIELD_KINDS)]
+        if spec["type"] != "check_box":
+            window.addContentWidget(AppleStyleLabel(f"Field {i}"))
+        widget = factory()
+        widget.setToolTip(f"Field {i}")
+        window.addContentWidget(widget)
+        widgets[f"field{i}"] = widget
+    return widgets
+
+
+def _timed(build, fields):
+    window = AppleStyleWindow("form")
+    started = time.perf_counter()
+    build(window, fields)
+    window.show()
+    QApplication.processEvents()
+    elapsed = time.perf_counter() - started
+    window.close()
+    window.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    return elapsed
+
+
+def run(fields=1000, repeats=3):
+    """Returns median seconds (hand-written, build_form) to build and show a form of `fields` fields."""
+    spec = form_spec(fields)
+    hand = [_timed(build_by_hand, fields) for _ in range(repeats)]
+    built = [_timed(lambda window, _: build_form(spec, window), fields) for _ in range(repeats)]
+    return statistics.median(hand), statistics.median(built)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    settings_dir = tempfile.TemporaryDirectory()
+    QSettings.setPath(QSettings.Format.IniFormat, QSettings.Scope.UserScope, settings_dir.name)
+    fields = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    hand, built = run(fields)
+    print(f"{fields} fields: hand-written {hand * 1000:.0f} ms, build_form {built * 1000:.0f} ms ({hand / built:.1f}x)")
@@ -0,0 +1,51 @@
+"""
+Import cost of apple_style_ui.
+
+Each statement runs in a fresh interpreter, so nothing is cached between
+samples. The bare package import and the palette import must not load Qt.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_import.py
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "package": "import apple_style_ui",
+    "palette": "from apple_style_ui import LIGHT_THEME, DARK_THEME",
+    "button": "from apple_style_ui import AppleStyleButton",
+    "window": "from apple_style_ui import AppleStyleWindow",
+    "everything": "from apple_style_ui import *",
+}
+
+_PROBE = """
+import sys, time, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "qt_loaded": "PyQt6.QtWidgets" in sys.modules}}))
+"""
+
+
+def run(statement, repeats=5):
+    """Returns (median seconds, whether QtWidgets was loaded) for importing with `statement`."""
+    samples = []
+    qt_loaded = False
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement=statement)],
+            check=True, capture_output=True, text=True, env=os.environ,
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        samples.append(result["seconds"])
+        qt_loaded = result["qt_loaded"]
+    return statistics.median(samples), qt_loaded
+
+
+if __name__ == "__main__":
+    for name, statement in STATEMENTS.items():
+        seconds, qt_loaded = run(statement)
+        print(f"{name:>10}: {seconds * 1e3:8.2f} ms{'  (loads QtWidgets)' if qt_loaded else ''}")
@@ -0,0 +1,89 @@
+"""
+Theme switch latency with per-widget stylesheets versus one application stylesheet.
+
+Builds a window holding 5,000 AppleStyle widgets in each style mode and times
+AppleStyleWindow.set_theme, including the re-polish and repaint that follow.
+In widget mode it also times restyling only the window itself: that must not
+grow with the content, as a stylesheet change on an ancestor would re-polish
+every widget below it.
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen PYTHONPATH=. python benchmarks/bench_theme_switch.py
+"""
+import sys
+import tempfile
+import time
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QSettings, QEvent
+
+import apple_style_ui
+from apple_style_ui import (
+    AppleStyleWindow, AppleStyleLabel, AppleStyleLineEdit, AppleStyleCheckBox,
+    AppleStyleComboBox, AppleStyleProgressBar,
+)
+
+WIDGET_FACTORIES = [
+    lambda i: AppleStyleLabel(f"Field {i}", is_secondary=bool(i % 2)),
+    lambda i: AppleStyleLineEdit(),
+    lambda i: AppleStyleCheckBox(f"Option {i}"),
+    lambda i: AppleStyleComboBox(),
+    lambda i: AppleStyleProgressBar(),
+]
+
+
+def _build(mode, widgets):
+    apple_style_ui.set_style_mode(mode)
+    window = AppleStyleWindow(f"{mode} mode")
+    for i in range(widgets):
+        window.addContentWidget(WIDGET_FACTORIES[i % len(WIDGET_FACTORIES)](i))
+    window.show()
+    QApplication.processEvents()
+    return window
+
+
+def _dispose(window):
+    window.close()
+    window.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value) # So the next run starts from an empty application
+
+
+def run(mode, widgets=5000, switches=4):
+    """Returns (construction seconds, mean seconds per theme switch) for the given style mode."""
+    started = time.perf_counter()
+    window = _build(mode, widgets)
+    constructed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for i in range(switches):
+        window.set_theme("dark" if i % 2 == 0 else "light")
+        QApplication.processEvents()
+    switched = (time.perf_counter() - started) / switches
+
+    _dispose(window)
+    return constructed, switched
+
+
+def run_window_chrome(widgets=5000, switches=4):
+    """Returns mean seconds to restyle only the window (not its content widgets) in widget mode."""
+    window = _build("widget", widgets)
+    started = time.perf_counter()
+    for i in range(switches):
+        apple_style_ui.activate_theme("dark" if i % 2 == 0 else "light")
+        window.update_theme()
+        QApplication.processEvents()
+    restyled = (time.perf_counter() - started) / switches
+    apple_style_ui.activate_theme("light")
+    _dispose(window)
+    return restyled
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    settings_dir = tempfile.TemporaryDirectory()
+    QSettings.setPath(QSettings.Format.IniFormat, QSettings.Scope.UserScope, settings_dir.name)
+
+    for mode in ("widget", "application"):
+        constructed, switched = run(mode)
+        print(f"{mode:>11} mode: construction {constructed * 1e3:8.1f} ms, theme switch {switched * 1e3:8.1f} ms")
+    print(f"widget mode window restyle alone: {run_window_chrome() * 1e3:8.1f} ms")
@@ -0,0 +1,282 @@
+"""
+Headless benchmark suite for the AppleStyle widgets.
+
+Measures import time, construction time, form building, theme switching,
+animation frames, paint cost and memory per widget, and writes the results as JSON. With --baseline the run is
+compared against an earlier result file and the exit status is 1 when any
+metric regressed by more than --threshold.
+
+Run from the repository root:
+    QT_QPA_PLATFORM=offscreen PYTHONPATH=. python benchmarks/run_benchmarks.py -o results.json
+    QT_QPA_PLATFORM=offscreen PYTHONPATH=. python benchmarks/run_benchmarks.py --baseline results.json
+"""
+import argparse
+import ctypes
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
+from PyQt6.QtCore import Qt, QSettings, QEvent, QT_VERSION_STR, PYQT_VERSION_STR
+
+import apple_style_ui
+from apple_style_ui import (
+    AppleStyleLabel, AppleStyleLineEdit, AppleStyleTextEdit, AppleStyleButton, AppleStyleCheckBox,
+    AppleStyleSwitch, AppleStyleSlider, AppleStyleRadioButton, AppleStyleComboBox, AppleStyleDateEdit,
+    AppleStyleProgressBar,
+)
+
+import bench_button_animation
+import bench_form_builder
+import bench_import
+import bench_theme_switch
+
+# One factory per benchmarked class
+WIDGET_FACTORIES = {
+    "AppleStyleLabel": lambda: AppleStyleLabel("Label"),
+    "AppleStyleLineEdit": AppleStyleLineEdit,
+    "AppleStyleTextEdit": AppleStyleTextEdit,
+    "AppleStyleButton": lambda: AppleStyleButton("Button"),
+    "AppleStyleCheckBox": lambda: AppleStyleCheckBox("Check"),
+    "AppleStyleSwitch": AppleStyleSwitch,
+    "AppleStyleSlider": lambda: AppleStyleSlider(Qt.Orientation.Horizontal),
+    "AppleStyleRadioButton": lambda: AppleStyleRadioButton("Radio"),
+    "AppleStyleComboBox": AppleStyleComboBox,
+    "AppleStyleDateEdit": AppleStyleDateEdit,
+    "AppleStyleProgressBar": AppleStyleProgressBar,
+}
+
+BENCHMARKS = []
+
+def benchmark(func):
+    BENCHMARKS.append(func)
+    return func
+
+
+def _flush_deletes():
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    gc.collect()
+
+
+class _MallInfo2(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_size_t) for name in (
+        "arena", "ordblks", "smblks", "hblks", "hblkhd", "usmblks", "fsmblks", "uordblks", "fordblks", "keepcost")]
+
+
+def _native_heap_bytes():
+    # Bytes in use on the C heap (glibc only); None elsewhere so only Python memory is reported
+    try:
+        mallinfo2 = ctypes.CDLL(None).mallinfo2
+    except (OSError, AttributeError):
+        return None
+    mallinfo2.restype = _MallInfo2
+    info = mallinfo2()
+    return info.uordblks + info.hblkhd
+
+
+def _median_time(func, repeats):
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+@benchmark
+def import_time(options):
+    results = {}
+    for name, statement in bench_import.STATEMENTS.items():
+        seconds, _ = bench_import.run(statement, options.repeats)
+        results[f"import.{name}"] = {"value": seconds, "unit": "s"}
+    return results
+
+
+@benchmark
+def construction(options):
+    results = {}
+    for name, factory in WIDGET_FACTORIES.items():
+        for count in options.counts:
+            def construct():
+                widgets = [factory() for _ in range(count)]
+                for widget in widgets:
+                    widget.deleteLater()
+            elapsed = _median_time(construct, 1 if count >= 1000 else options.repeats)
+            _flush_deletes()
+            results[f"construction.{name}.{count}"] = {"value": elapsed / count, "unit": "s/widget"}
+    return results
+
+
+@benchmark
+def form_builder(options):
+    hand, built = bench_form_builder.run(options.form_fields, options.repeats)
+    return {
+        f"form.hand_written.{options.form_fields}": {"value": hand, "unit": "s"},
+        f"form.build_form.{options.form_fields}": {"value": built, "unit": "s"},
+    }
+
+
+@benchmark
+def theme_switch(options):
+    results = {}
+    for mode in ("widget", "application"):
+        _, switched = bench_theme_switch.run(mode, widgets=options.form_size)
+        results[f"set_theme.{mode}.{options.form_size}"] = {"value": switched, "unit": "s"}
+    results[f"set_theme.widget.window_only.{options.form_size}"] = {
+        "value": bench_theme_switch.run_window_chrome(widgets=options.form_size), "unit": "s"}
+    apple_style_ui.set_style_mode("widget")
+    return results
+
+
+@benchmark
+def animation_frames(options):
+    results = {
+        "frame.AnimatedButton": {"value": bench_button_animation.run(AppleStyleButton), "unit": "s/frame"},
+    }
+
+    # AppleStyleSwitch: one frame is a fractional circlePosition write plus a synchronous repaint
+    switch = AppleStyleSwitch()
+    switch.show()
+    QApplication.processEvents()
+    off_pos, on_pos = switch._handle_range()
+    positions = [off_pos + (on_pos - off_pos) * i / options.frames for i in range(options.frames + 1)]
+    def sweep():
+        for position in positions:
+            switch.circlePosition = position
+            switch.repaint()
+    results["frame.AppleStyleSwitch"] = {"value": _median_time(sweep, options.repeats) / len(positions), "unit": "s/frame"}
+    switch.close()
+    return results
+
+
+@benchmark
+def paint(options):
+    results = {}
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    widgets = {
+        "AppleStyleCheckBox": AppleStyleCheckBox("Checked"),
+        "AppleStyleRadioButton": AppleStyleRadioButton("Checked"),
+    }
+    for widget in widgets.values():
+        widget.setChecked(True)
+        layout.addWidget(widget)
+    container.show()
+    QApplication.processEvents()
+    for name, widget in widgets.items():
+        def repaint():
+            for _ in range(options.frames):
+                widget.repaint()
+        results[f"paint.{name}"] = {"value": _median_time(repaint, options.repeats) / options.frames, "unit": "s/paint"}
+    container.close()
+    return results
+
+
+@benchmark
+def memory(options):
+    # Widgets are shown so that polish and style data are included
+    results = {}
+    count = options.memory_count
+    for name, factory in WIDGET_FACTORIES.items():
+        _flush_deletes()
+        native_before = _native_heap_bytes()
+        tracemalloc.start()
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        for _ in range(count):
+            layout.addWidget(factory())
+        container.show()
+        QApplication.processEvents()
+        python_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        native_after = _native_heap_bytes()
+        if native_before is not None:
+            results[f"memory.{name}.native"] = {"value": max(native_after - native_before, 0) / count, "unit": "bytes/widget"}
+        results[f"memory.{name}.python"] = {"value": python_bytes / count, "unit": "bytes/widget"}
+        container.close()
+        container.deleteLater()
+    _flush_deletes()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Prints a comparison table and returns the names of metrics slower than baseline by more than threshold."""
+    regressions = []
+    print(f"{'metric':<48} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None or not previous["value"]:
+            print(f"{name:<48} {'-':>12} {result['value']:>12.4g} {'new':>8}")
+            continue
+        change = result["value"] / previous["value"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<48} {previous['value']:>12.4g} {result['value']:>12.4g} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before a metric counts as a regression (default 0.10)")
+    parser.add_argument("--only", action="append", choices=[func.__name__ for func in BENCHMARKS], help="run only these benchmarks")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 100, 10000], help="instance counts for construction")
+    parser.add_argument("--form-size", type=int, default=2000, help="widgets in the set_theme form")
+    parser.add_argument("--form-fields", type=int, default=1000, help="fields in the form_builder form")
+    parser.add_argument("--memory-count", type=int, default=500, help="instances per class for memory measurement")
+    parser.add_argument("--frames", type=int, default=50, help="frames per animation/paint measurement")
+    parser.add_argument("--repeats", type=int, default=5, help="repeats per timing; the median is reported")
+    options = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    settings_dir = tempfile.TemporaryDirectory() # Keeps set_theme from writing the user's settings
+    QSettings.setPath(QSettings.Format.IniFormat, QSettings.Scope.UserScope, settings_dir.name)
+
+    results = {}
+    for func in BENCHMARKS:
+        if options.only and func.__name__ not in options.only:
+            continue
+        print(f"running {func.__name__}...", file=sys.stderr)
+        results.update(func(options))
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa": app.platformName(),
+        },
+        "results": results,
+    }
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+
+    if options.baseline:
+        with open(options.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(results, baseline, options.threshold)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed by more than {options.threshold:.0%}", file=sys.stderr)
+            return 1
+    elif not options.output:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
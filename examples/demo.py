@@ -0,0 +1,180 @@
+"""Profile form showing every AppleStyle widget; formerly the __main__ block of apple_style_ui.py."""
+import sys
+from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout, QMessageBox
+from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtGui import QShortcut, QKeySequence
+
+from apple_style_ui import (
+    AppleStyleWindow,
+    AppleStyleLabel,
+    AppleStyleLineEdit,
+    AppleStyleTextEdit,
+    AppleStyleButton,
+    AppleStyleCheckBox,
+    AppleStyleSwitch,
+    AppleStyleSlider,
+    AppleStyleRadioButton,
+    AppleStyleComboBox,
+    AppleStyleDateEdit,
+    AppleStyleProgressBar,
+)
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    # Ensure settings are initialized for the application
+    QApplication.setOrganizationName("MyCompany")
+    QApplication.setApplicationName("AppleStyleApp")
+
+
+    main_window = AppleStyleWindow("My Apple-like Application")
+
+    title_label = AppleStyleLabel("User Profile", font_size=22)
+    title_label.setStyleSheet(title_label.styleSheet() + "font-weight: bold; padding-bottom: 10px;")
+    main_window.addContentWidget(title_label)
+
+    name_label = AppleStyleLabel("Full Name:")
+    name_input = AppleStyleLineEdit()
+    name_input.setPlaceholderText("Enter your full name")
+    name_input.setToolTip("Enter your full name here. You can drag and drop a file path here.")
+    main_window.addContentWidget(name_label)
+    main_window.addContentWidget(name_input)
+
+    email_label = AppleStyleLabel("Email Address:", is_secondary=True)
+    email_input = AppleStyleLineEdit()
+    email_input.setPlaceholderText("you@example.com")
+    email_input.setToolTip("Enter your email address.")
+    main_window.addContentWidget(email_label)
+    main_window.addContentWidget(email_input)
+
+    address_label = AppleStyleLabel("Address (Disabled):", is_secondary=True)
+    address_input = AppleStyleLineEdit()
+    address_input.setPlaceholderText("Your address here")
+    address_input.setEnabled(False)
+    main_window.addContentWidget(address_label)
+    main_window.addContentWidget(address_input)
+
+    bio_label = AppleStyleLabel("Biography:")
+    bio_text_edit = AppleStyleTextEdit()
+    bio_text_edit.setPlaceholderText("Tell us something about yourself...")
+    bio_text_edit.setFixedHeight(100)
+    bio_text_edit.setToolTip("Write a short biography.")
+    main_window.addContentWidget(bio_label)
+    main_window.addContentWidget(bio_text_edit)
+
+    gender_label = AppleStyleLabel("Gender:")
+    main_window.addContentWidget(gender_label)
+    gender_layout_widget = QWidget() # Container for radio buttons
+    gender_layout = QHBoxLayout(gender_layout_widget)
+    gender_layout.setContentsMargins(0,0,0,0) # No extra margins for this internal layout
+    male_radio = AppleStyleRadioButton("Male")
+    female_radio = AppleStyleRadioButton("Female")
+    other_radio = AppleStyleRadioButton("Other")
+    gender_layout.addWidget(male_radio)
+    gender_layout.addWidget(female_radio)
+    gender_layout.addWidget(other_radio)
+    male_radio.setChecked(True)
+    main_window.addContentWidget(gender_layout_widget)
+
+
+    occupation_label = AppleStyleLabel("Occupation:")
+    main_window.addContentWidget(occupation_label)
+    occupation_combo = AppleStyleComboBox()
+    occupation_combo.addItems(["Student", "Engineer", "Designer", "Manager", "Other"])
+    occupation_combo.setCurrentText("Other")
+    occupation_combo.setToolTip("Select your occupation.")
+    main_window.addContentWidget(occupation_combo)
+
+    birthday_label = AppleStyleLabel("Birthday:")
+    main_window.addContentWidget(birthday_label)
+    birthday_edit = AppleStyleDateEdit()
+    birthday_edit.setDisplayFormat("yyyy-MM-dd")
+    birthday_edit.setDate(QDate.currentDate())
+    birthday_edit.setToolTip("Select your birth date.")
+    main_window.addContentWidget(birthday_edit)
+
+    newsletter_label = AppleStyleLabel("Preferences:")
+    main_window.addContentWidget(newsletter_label)
+    newsletter_checkbox = AppleStyleCheckBox("Subscribe to newsletter")
+    newsletter_checkbox.setChecked(True)
+    newsletter_checkbox.setToolTip("Toggle newsletter subscription.")
+    main_window.addContentWidget(newsletter_checkbox)
+
+    enable_features_label = AppleStyleLabel("Enable Experimental Features:")
+    main_window.addContentWidget(enable_features_label)
+    feature_switch = AppleStyleSwitch()
+    feature_switch.setToolTip("Toggle experimental features on or off.")
+    main_window.addContentWidget(feature_switch)
+
+    volume_label = AppleStyleLabel("Volume:")
+    main_window.addContentWidget(volume_label)
+    volume_slider = AppleStyleSlider(Qt.Orientation.Horizontal)
+    volume_slider.setRange(0, 100)
+    volume_slider.setValue(75)
+    volume_slider.setToolTip("Adjust the volume level.")
+    main_window.addContentWidget(volume_slider)
+
+    progress_label = AppleStyleLabel("Task Progress:")
+    main_window.addContentWidget(progress_label)
+    progress_bar = AppleStyleProgressBar()
+    progress_bar.setValue(50)
+    progress_bar.setToolTip("Shows the progress of a task.")
+    main_window.addContentWidget(progress_bar)
+
+
+    # --- Buttons ---
+    buttons_layout_widget = QWidget() # Container for main action buttons
+    buttons_layout = QHBoxLayout(buttons_layout_widget)
+    buttons_layout.setContentsMargins(0,0,0,0)
+
+
+    theme_button = AppleStyleButton("Toggle Theme", is_secondary=True)
+    def toggle_theme():
+        current_theme_name = main_window.current_theme
+        if current_theme_name == "light":
+            main_window.set_theme("dark")
+        else:
+            main_window.set_theme("light")
+
+
+    theme_button.clicked.connect(toggle_theme)
+    theme_button.setToolTip("Switch between light and dark themes.")
+    buttons_layout.addWidget(theme_button)
+
+
+    help_button = AppleStyleButton("Help", is_secondary=True)
+    def show_help():
+        QMessageBox.information(main_window, "Help", "This is a sample application demonstrating Apple-like UI elements with various features.")
+    help_button.clicked.connect(show_help)
+    help_button.setToolTip("Show help information.")
+    buttons_layout.addWidget(help_button)
+
+    buttons_layout.addStretch(1) # Add stretch to push next buttons to the right
+
+    button_submit = AppleStyleButton("Save Changes")
+    save_shortcut = QShortcut(QKeySequence.StandardKey.Save, main_window)
+    def on_submit():
+        print(f"Name: {name_input.text()}")
+        print(f"Email: {email_input.text()}")
+        print(f"Bio: {bio_text_edit.toPlainText()}")
+        main_window.show_message("Settings saved successfully!")
+    button_submit.clicked.connect(on_submit)
+    save_shortcut.activated.connect(on_submit)
+    button_submit.setToolTip("Save your changes (Ctrl+S / Cmd+S)")
+    buttons_layout.addWidget(button_submit)
+
+    button_cancel = AppleStyleButton("Cancel", is_secondary=True)
+    button_cancel.setToolTip("Discard changes and exit (not implemented).")
+    buttons_layout.addWidget(button_cancel)
+    
+    main_window.addContentWidget(buttons_layout_widget)
+
+
+    disabled_action_button = AppleStyleButton("Another Action (Disabled)")
+    disabled_action_button.setEnabled(False)
+    disabled_action_button.setToolTip("This action is currently disabled.")
+    main_window.addContentWidget(disabled_action_button)
+
+    main_window.addStretch()
+
+    main_window.show()
+    sys.exit(app.exec())
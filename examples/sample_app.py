@@ -16,7 +16,6 @@ from apple_style_ui import (
     AppleStyleComboBox,
     AppleStyleDateEdit,
     AppleStyleProgressBar,
-    get_color, # Import the get_color function
 )
 
 class ComprehensiveSampleApp(AppleStyleWindow):
@@ -116,9 +115,6 @@ class ComprehensiveSampleApp(AppleStyleWindow):
         self.progress_timer.timeout.connect(self._update_progress)
         self.progress_value = 0
 
-        # Message Label (already part of AppleStyleWindow, we'll use it via show_message)
-        # self.addContentWidget(self.message_label) # Added in AppleStyleWindow
-
         # --- Action Buttons ---
         actions_label = AppleStyleLabel("Actions:", font_size=16)
         actions_label.setStyleSheet(actions_label.styleSheet() + "padding-top: 10px;")
@@ -128,12 +124,12 @@ class ComprehensiveSampleApp(AppleStyleWindow):
         buttons_layout = QHBoxLayout(buttons_widget)
         buttons_layout.setContentsMargins(0,0,0,0)
 
-        self.theme_button = AppleStyleButton("Toggle Theme")
+        self.theme_button = AppleStyleButton("Toggle Theme", is_secondary=True)
         self.theme_button.setToolTip("Switch between light and dark UI themes.")
-        self.theme_button.clicked.connect(self._toggle_theme_and_buttons_style)
+        self.theme_button.clicked.connect(self._toggle_theme)
         buttons_layout.addWidget(self.theme_button)
 
-        self.help_button = AppleStyleButton("Help")
+        self.help_button = AppleStyleButton("Help", is_secondary=True)
         self.help_button.setToolTip("Show application help.")
         self.help_button.clicked.connect(self._show_help_dialog)
         buttons_layout.addWidget(self.help_button)
@@ -150,13 +146,7 @@ class ComprehensiveSampleApp(AppleStyleWindow):
 
         self.addContentWidget(buttons_widget)
 
-        # Apply initial styles to secondary buttons
-        self._style_secondary_button(self.theme_button)
-        self._style_secondary_button(self.help_button)
-
-        # Add message label to the layout (it's created in AppleStyleWindow)
-        self.layout.addWidget(self.message_label)
-        self.addStretch() # Ensure content is pushed up, and message label is above stretch
+        self.addStretch() # Ensure content is pushed up
 
         # Start progress simulation
         self.progress_timer.start(100) # Update every 100ms
@@ -167,24 +157,12 @@ class ComprehensiveSampleApp(AppleStyleWindow):
             self.progress_value = 0
         self.progress_bar.setValue(self.progress_value)
 
-    def _style_secondary_button(self, button):
-        button._update_colors() # Ensure base colors are from current theme
-        button._default_bg_color = get_color("separator")
-        button._hover_bg_color = get_color("disabled_background")
-        button._pressed_bg_color = get_color("input_border")
-        button._text_color = get_color("text_primary")
-        button._current_bg_color = button._default_bg_color
-        button._apply_style()
-
-    def _toggle_theme_and_buttons_style(self):
+    def _toggle_theme(self):
         current_theme_name = self.current_theme
         if current_theme_name == "light":
             self.set_theme("dark")
         else:
             self.set_theme("light")
-        # Re-style secondary buttons after theme change
-        self._style_secondary_button(self.theme_button)
-        self._style_secondary_button(self.help_button)
 
     def _show_help_dialog(self):
         QMessageBox.information(self, "Help",